@@ -1,15 +1,9 @@
 import sys
-import os
 import logging
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtGui import QFont
 
-# Add src directory
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from ui.main_window import MainWindow
-from utils.logger import setup_logger
+from src.utils.logger import setup_logger
 
 def main():
     # Setup logging
@@ -28,15 +22,17 @@ def main():
     app.setStyle('Fusion')
     
     # Apply dark theme palette
-    from ui.theme import apply_dark_theme
+    from src.ui.theme import apply_dark_theme
     apply_dark_theme(app)
     
     # Set default font
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     
-    # Create and show main window
+    # Create and show main window (UI modules are imported only once the app exists)
     try:
+        from src.ui.main_window import MainWindow
+        
         main_window = MainWindow()
         main_window.show()
         
@@ -1,7 +1,5 @@
 import sys
-import subprocess
-import platform
-import os
+from functools import lru_cache
 from pathlib import Path
 
 def check_python_version():
@@ -15,10 +13,17 @@ def check_python_version():
     print(f"✅ Python {version.major}.{version.minor}.{version.micro} detected")
     return True
 
+@lru_cache(maxsize=None)
+def _platform_system():
+    """Get the OS name (cached; it cannot change during a run)"""
+    import platform
+    
+    return platform.system()
+
 def check_platform():
     """Check platform compatibility"""
-    system = platform.system()
-    print(f"✅ Platform: {system} {platform.release()}")
+    system = _platform_system()
+    print(f"✅ Platform: {system}")
     
     if system not in ["Windows", "Darwin", "Linux"]:
         print("⚠️  Platform may not be fully supported")
@@ -30,6 +35,8 @@ def install_dependencies():
     """Install required dependencies"""
     print("\n📦 Installing dependencies...")
     
+    import subprocess
+    
     try:
         # Install from requirements.txt
         result = subprocess.run([
@@ -48,6 +55,34 @@ def install_dependencies():
         print(f"❌ Error installing dependencies: {e}")
         return False
 
+def compile_bytecode():
+    """Pre-compile application modules so the first launch skips bytecode generation"""
+    print("\n⚙️  Compiling application modules...")
+    
+    # Respect PYTHONDONTWRITEBYTECODE / python -B
+    if sys.dont_write_bytecode:
+        print("⚠️  Bytecode writing disabled - skipping")
+        return True
+    
+    import subprocess
+    
+    try:
+        result = subprocess.run([
+            sys.executable, "-m", "compileall", "-j", "0", "-q", "src", "main.py"
+        ], capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            print("✅ Modules compiled")
+            return True
+        else:
+            print("⚠️  Some modules failed to compile")
+            print(result.stdout or result.stderr)
+            return False
+            
+    except Exception as e:
+        print(f"⚠️  Error compiling modules: {e}")
+        return False
+
 def create_directories():
     """Create necessary directories"""
     print("\n📁 Creating directories...")
@@ -62,24 +97,38 @@ def create_directories():
         Path(directory).mkdir(exist_ok=True)
         print(f"✅ Created: {directory}/")
 
+def _try_import(module):
+    """Import a module by name, returning True on success"""
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
 def test_imports():
     """Test if all required modules can be imported"""
     print("\n🧪 Testing imports...")
     
+    from concurrent.futures import ThreadPoolExecutor
+    
     modules = [
         ("PyQt5.QtWidgets", "PyQt5"),
         ("cv2", "OpenCV"),
+        ("mediapipe.python.solutions.face_mesh", "MediaPipe"),
         ("psutil", "psutil"),
         ("cryptography.fernet", "cryptography")
     ]
     
+    # The extensions are independent, so load them concurrently
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        results = list(executor.map(_try_import, [module for module, _ in modules]))
+    
     failed_imports = []
     
-    for module, name in modules:
-        try:
-            __import__(module)
+    for (module, name), ok in zip(modules, results):
+        if ok:
             print(f"✅ {name}")
-        except ImportError:
+        else:
             print(f"❌ {name}")
             failed_imports.append(name)
     
@@ -126,11 +175,14 @@ def main():
         print("\n❌ Setup failed - could not install dependencies")
         sys.exit(1)
     
+    # Pre-compile bytecode (not fatal if it fails)
+    compile_bytecode()
+    
     # Test imports
     if not test_imports():
         print("\n❌ Setup incomplete - some modules failed to import")
         print("Try installing missing dependencies manually:")
-        print("pip install PyQt5 opencv-python psutil cryptography")
+        print('pip install PyQt5 opencv-python "mediapipe<0.10.30" psutil cryptography')
         sys.exit(1)
     
     # Test camera
@@ -1,15 +1,21 @@
 """
 Core Package - Contains core business logic and managers
 """
-# Import core components
-from .auth_manager import AuthManager
-from .eye_tracker import EyeTracker
-from .system_monitor import SystemMonitor
-from .data_manager import DataManager
+import importlib
 
-__all__ = [
-    'AuthManager',
-    'EyeTracker',
-    'SystemMonitor',
-    'DataManager'
-]
+# Core components, imported on first access so that loading one manager
+# (e.g. authentication) does not pull in the eye tracker and OpenCV
+_EXPORTS = {
+    'AuthManager': '.auth_manager',
+    'EyeTracker': '.eye_tracker',
+    'SystemMonitor': '.system_monitor',
+    'DataManager': '.data_manager'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """Import an exported component on first access"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
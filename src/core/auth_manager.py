@@ -3,12 +3,18 @@ Authentication Manager - Handles user authentication
 """
 import logging
 import hashlib
-import json
-import os
+import hmac
 from PyQt5.QtCore import QObject, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# Demo user password digests, computed once at import
+_DEMO_USER_DIGESTS = {
+    "admin": hashlib.sha256(b"password").digest(),
+    "user": hashlib.sha256(b"user123").digest(),
+    "demo": hashlib.sha256(b"demo").digest()
+}
+
 class AuthManager(QObject):
     """Manages user authentication and session state"""
     
@@ -23,11 +29,7 @@ class AuthManager(QObject):
         self.is_authenticated = False
         
         # Demo users (in production, this would be handled by a proper backend)
-        self.demo_users = {
-            "admin": self._hash_password("password"),
-            "user": self._hash_password("user123"),
-            "demo": self._hash_password("demo")
-        }
+        self.demo_users = dict(_DEMO_USER_DIGESTS)
         
         logger.info("Auth manager initialized")
     
@@ -46,9 +48,10 @@ class AuthManager(QObject):
             # Hash the provided password
             password_hash = self._hash_password(password)
             
-            # Check against demo users
-            if username in self.demo_users:
-                if self.demo_users[username] == password_hash:
+            # Check against demo users (constant-time digest comparison)
+            expected_hash = self.demo_users.get(username)
+            if expected_hash is not None:
+                if hmac.compare_digest(expected_hash, password_hash):
                     self.current_user = username
                     self.is_authenticated = True
                     
@@ -82,9 +85,10 @@ class AuthManager(QObject):
         """Check if user is currently authenticated"""
         return self.is_authenticated
     
-    def _hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    @staticmethod
+    def _hash_password(password):
+        """Hash password using SHA-256 (raw digest bytes)"""
+        return hashlib.sha256(password.encode()).digest()
     
     def validate_session(self):
         """Validate current session (for future implementation)"""
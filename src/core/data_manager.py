@@ -3,20 +3,136 @@ Data Manager - Handles local data storage and cloud synchronization
 """
 import logging
 import sqlite3
-import json
 import os
 import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer
+
+from .database import acquire_connection, release_connection
 
 logger = logging.getLogger(__name__)
 
+# Buffered writes are flushed every second, or sooner once this many rows are queued
+FLUSH_INTERVAL_MS = 1000
+FLUSH_BATCH_SIZE = 100
+
+# Numeric SystemMetrics fields, in _SQL_INSERT_METRIC column order (missing values stored as 0)
+_METRIC_KEYS = ('cpu_percent', 'memory_percent', 'memory_used_mb', 'disk_usage_percent')
+
+_SQL_INSERT_METRIC = '''
+    INSERT INTO system_metrics
+    (user_id, timestamp, cpu_percent, memory_percent, memory_used_mb,
+     disk_usage_percent, network_available, battery_percent, power_connected)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_BLINK = '''
+    INSERT INTO blink_events (user_id, session_id, timestamp)
+    VALUES (?, ?, ?)
+'''
+
+# STRICT tables need SQLite 3.37+; older libraries get a plain table
+_BLINK_TABLE_OPTIONS = 'STRICT' if sqlite3.sqlite_version_info >= (3, 37, 0) else ''
+
+# The AUTOINCREMENT id only grows, so it bounds sync passes like the other tables' ids
+_SQL_CREATE_BLINK_EVENTS = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        session_id INTEGER NOT NULL,  -- 0 when the blink is not tied to a session
+        timestamp INTEGER NOT NULL,  -- unix epoch milliseconds
+        synced INTEGER NOT NULL DEFAULT 0
+    ) {options}
+'''
+
+_SQL_UNSYNCED_TOTAL = '''
+    SELECT
+        (SELECT COUNT(*) FROM system_metrics WHERE synced = 0) +
+        (SELECT COUNT(*) FROM eye_sessions WHERE synced = 0) +
+        (SELECT COUNT(*) FROM blink_events WHERE synced = 0)
+'''
+
+# Highest row id per table when a sync starts: system_metrics, eye_sessions, blink_events
+_SQL_SYNC_HIGH_WATER = '''
+    SELECT
+        (SELECT COALESCE(MAX(id), 0) FROM system_metrics),
+        (SELECT COALESCE(MAX(id), 0) FROM eye_sessions),
+        (SELECT COALESCE(MAX(id), 0) FROM blink_events)
+'''
+
+# Same table order as _SQL_SYNC_HIGH_WATER
+_SQL_MARK_SYNCED = (
+    'UPDATE system_metrics SET synced = 1 WHERE synced = 0 AND id <= ?',
+    'UPDATE eye_sessions SET synced = 1 WHERE synced = 0 AND id <= ?',
+    'UPDATE blink_events SET synced = 1 WHERE synced = 0 AND id <= ?',
+)
+
+# Rows sampled per index when gathering planner statistics
+_ANALYSIS_LIMIT = 400
+
+# Explicitly created indexes (automatic ones have no SQL)
+_SQL_NAMED_INDEXES = "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+
+_SQL_TABLE_COUNTS = '''
+    SELECT
+        (SELECT COUNT(*) FROM eye_sessions),
+        (SELECT COUNT(*) FROM system_metrics),
+        (SELECT COUNT(*) FROM blink_events),
+        (SELECT COUNT(*) FROM system_metrics WHERE synced = 0)
+'''
+
+_SQL_SESSION_STATS = '''
+    SELECT s.session_count, s.avg_blinks, s.avg_bpm, s.high_strain_sessions, m.avg_cpu, m.avg_memory
+    FROM (
+        SELECT
+            COUNT(*) AS session_count,
+            AVG(total_blinks) AS avg_blinks,
+            AVG(blinks_per_minute) AS avg_bpm,
+            SUM(CASE WHEN eye_strain_level = 'high' THEN 1 ELSE 0 END) AS high_strain_sessions
+        FROM eye_sessions
+        WHERE user_id = :user_id AND session_start >= :cutoff
+    ) s
+    CROSS JOIN (
+        SELECT
+            AVG(cpu_percent) AS avg_cpu,
+            AVG(memory_percent) AS avg_memory
+        FROM system_metrics
+        WHERE user_id = :user_id AND timestamp >= :cutoff
+    ) m
+'''
+
+class _SyncTask(QRunnable):
+    """Runs one sync pass for a DataManager on the global thread pool"""
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+    
+    def run(self):
+        self.manager._run_sync()
+
+class _FlushTask(QRunnable):
+    """Writes a DataManager's buffered rows on the global thread pool"""
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+    
+    def run(self):
+        try:
+            self.manager._flush()
+        finally:
+            self.manager._flush_scheduled = False
+
 class DataManager(QObject):
     """Manages local data storage and cloud synchronization"""
     
     # Signals
     data_saved = pyqtSignal(dict)
+    data_flushed = pyqtSignal(int)  # rows written
     sync_completed = pyqtSignal(bool)  # success
     sync_status_changed = pyqtSignal(str)  # status message
     
@@ -25,7 +141,7 @@ class DataManager(QObject):
         
         # Database path
         self.db_path = Path("data/wellness_tracker.db")
-        self.db_path.parent.mkdir(exist_ok=True)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Sync state
         self.is_syncing = False
@@ -36,167 +152,284 @@ class DataManager(QObject):
         self.sync_timer = QTimer()
         self.sync_timer.timeout.connect(self.sync_data)
         
-        # Thread lock for database operations
-        self.db_lock = threading.Lock()
+        # Write buffers (flushed in batches by the flush timer)
+        self._buffer_lock = threading.Lock()
+        self._metric_buf = deque()
+        self._blink_buf = deque()
+        self._flush_scheduled = False
+        
+        # Shared long-lived connection and its lock (guards every database operation)
+        self._conn, self.db_lock = acquire_connection(self.db_path)
+        self._cursor = self._conn.cursor()
         
         # Initialize database
-        self._init_database()
+        with self.db_lock:
+            self._init_database()
+        
+        # Flush timer (the write itself runs on the thread pool)
+        self.flush_timer = QTimer()
+        self.flush_timer.timeout.connect(self._schedule_flush)
+        self.flush_timer.start(FLUSH_INTERVAL_MS)
         
         # Start auto-sync (every 5 minutes)
         self.sync_timer.start(300000)
         
+        # Checkpoint and close the database when the application quits
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.save_pending_data)
+        
         logger.info("Data manager initialized")
     
     def _init_database(self):
         """Initialize SQLite database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Create eye tracking sessions table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS eye_sessions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id TEXT NOT NULL,
-                        session_start TIMESTAMP NOT NULL,
-                        session_end TIMESTAMP,
-                        total_blinks INTEGER DEFAULT 0,
-                        blinks_per_minute REAL DEFAULT 0.0,
-                        eye_strain_level TEXT DEFAULT 'normal',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        synced INTEGER DEFAULT 0
-                    )
-                ''')
-                
-                # Create system metrics table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS system_metrics (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id TEXT NOT NULL,
-                        timestamp TIMESTAMP NOT NULL,
-                        cpu_percent REAL NOT NULL,
-                        memory_percent REAL NOT NULL,
-                        memory_used_mb REAL NOT NULL,
-                        disk_usage_percent REAL,
-                        network_available INTEGER DEFAULT 0,
-                        battery_percent REAL,
-                        power_connected INTEGER,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        synced INTEGER DEFAULT 0
-                    )
-                ''')
-                
-                # Create blink events table (detailed tracking)
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS blink_events (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id TEXT NOT NULL,
-                        session_id INTEGER,
-                        timestamp TIMESTAMP NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        synced INTEGER DEFAULT 0,
-                        FOREIGN KEY (session_id) REFERENCES eye_sessions (id)
-                    )
-                ''')
-                
-                # Create sync log table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS sync_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        sync_time TIMESTAMP NOT NULL,
-                        records_synced INTEGER NOT NULL,
-                        success INTEGER NOT NULL,
-                        error_message TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                conn.commit()
-                logger.info("Database initialized successfully")
+            cursor = self._cursor
+            
+            # Create eye tracking sessions table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS eye_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    session_start TIMESTAMP NOT NULL,
+                    session_end TIMESTAMP,
+                    total_blinks INTEGER DEFAULT 0,
+                    blinks_per_minute REAL DEFAULT 0.0,
+                    eye_strain_level TEXT DEFAULT 'normal',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    synced INTEGER DEFAULT 0
+                )
+            ''')
+            
+            # Create system metrics table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS system_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    timestamp TIMESTAMP NOT NULL,
+                    cpu_percent REAL NOT NULL,
+                    memory_percent REAL NOT NULL,
+                    memory_used_mb REAL NOT NULL,
+                    disk_usage_percent REAL,
+                    network_available INTEGER DEFAULT 0,
+                    battery_percent REAL,
+                    power_connected INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    synced INTEGER DEFAULT 0
+                )
+            ''')
+            
+            # Create blink events table (detailed tracking)
+            cursor.execute(_SQL_CREATE_BLINK_EVENTS.format(table='blink_events', options=_BLINK_TABLE_OPTIONS))
+            self._migrate_blink_events()
+            
+            # Create sync log table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sync_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sync_time TIMESTAMP NOT NULL,
+                    records_synced INTEGER NOT NULL,
+                    success INTEGER NOT NULL,
+                    error_message TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Partial indexes so unsynced counts only touch pending rows
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_metrics_unsynced ON system_metrics(id) WHERE synced = 0')
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_sessions_unsynced ON eye_sessions(id) WHERE synced = 0')
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_blinks_unsynced ON blink_events(id) WHERE synced = 0')
+            
+            # Composite indexes for per-user date range queries (get_session_stats)
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_sessions_user_start ON eye_sessions(user_id, session_start)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_metrics_user_ts ON system_metrics(user_id, timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS ix_blinks_user_ts ON blink_events(user_id, timestamp)')
+            
+            # Give the planner statistics for the new indexes without a full scan,
+            # sampling a bounded number of rows per index
+            cursor.execute(f'PRAGMA analysis_limit={_ANALYSIS_LIMIT}')
+            if sqlite3.sqlite_version_info >= (3, 46, 0):
+                # 0x10000: at connection open, check every table, not just queried ones
+                cursor.execute('PRAGMA optimize=0x10002')
+            else:
+                # Older optimize ignores tables it has not seen queried; analyze unanalyzed indexes
+                for index in self._indexes_without_stats():
+                    cursor.execute(f'ANALYZE "{index}"')
+            logger.info("Database initialized successfully")
                 
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
-    def save_session_data(self, eye_data, system_data):
-        """Save current session data to local database"""
+    def _indexes_without_stats(self):
+        """Get named indexes that have no planner statistics yet"""
+        cursor = self._cursor
+        
+        cursor.execute(_SQL_NAMED_INDEXES)
+        indexes = [name for (name,) in cursor.fetchall()]
+        
+        # sqlite_stat1 only exists once something has been analyzed
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            return indexes
+        
+        cursor.execute('SELECT DISTINCT idx FROM sqlite_stat1')
+        analyzed = {name for (name,) in cursor.fetchall()}
+        return [name for name in indexes if name not in analyzed]
+    
+    def _migrate_blink_events(self):
+        """Rebuild an older blink_events table (ISO timestamps or a WITHOUT ROWID key) in the current layout"""
+        cursor = self._cursor
+        
+        # Current layout: an id primary key and integer millisecond timestamps
+        cursor.execute('PRAGMA table_info(blink_events)')
+        columns = {row[1]: (row[2].upper(), row[5]) for row in cursor.fetchall()}
+        if columns.get('id', ('', 0))[1] and columns.get('timestamp', ('', 0))[0] == 'INTEGER':
+            return
+        
+        logger.info("Migrating blink_events table")
+        
+        cursor.execute('BEGIN IMMEDIATE')
         try:
-            with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Get current user (from auth manager or default)
-                    user_id = self._get_current_user_id()
-                    current_time = datetime.now()
-                    
-                    # Save system metrics
-                    cursor.execute('''
-                        INSERT INTO system_metrics 
-                        (user_id, timestamp, cpu_percent, memory_percent, memory_used_mb,
-                         disk_usage_percent, network_available, battery_percent, power_connected)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+            cursor.execute('DROP TABLE IF EXISTS blink_events_new')
+            cursor.execute(_SQL_CREATE_BLINK_EVENTS.format(table='blink_events_new', options=_BLINK_TABLE_OPTIONS))
+            
+            # Older rows may hold local-time ISO strings; convert them to unix milliseconds
+            # and number the rows in time order
+            cursor.execute('''
+                INSERT INTO blink_events_new (user_id, session_id, timestamp, synced)
+                SELECT user_id, session_id, ts, synced FROM (
+                    SELECT
                         user_id,
-                        current_time,
-                        system_data.get('cpu_percent', 0),
-                        system_data.get('memory_percent', 0),
-                        system_data.get('memory_used_mb', 0),
-                        system_data.get('disk_usage_percent', 0),
-                        1 if system_data.get('network_available', False) else 0,
-                        system_data.get('battery_percent'),
-                        1 if system_data.get('power_connected', False) else 0
-                    ))
-                    
-                    # Update pending sync count
-                    self.pending_sync_count += 1
-                    
-                    conn.commit()
-                    
-                    logger.debug("Session data saved to local database")
-                    self.data_saved.emit({
-                        'eye_data': eye_data,
-                        'system_data': system_data,
-                        'timestamp': current_time
-                    })
-                    
+                        COALESCE(session_id, 0) AS session_id,
+                        CASE typeof(timestamp)
+                            WHEN 'integer' THEN timestamp
+                            ELSE CAST(ROUND((julianday(timestamp, 'utc') - 2440587.5) * 86400000) AS INTEGER)
+                        END AS ts,
+                        COALESCE(synced, 0) AS synced
+                    FROM blink_events
+                )
+                ORDER BY ts
+            ''')
+            
+            cursor.execute('DROP TABLE blink_events')
+            cursor.execute('ALTER TABLE blink_events_new RENAME TO blink_events')
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+    
+    def save_session_data(self, eye_data, system_data):
+        """Queue current session data for the next batched write"""
+        try:
+            # Get current user (from auth manager or default)
+            user_id = self._get_current_user_id()
+            current_time = datetime.now()
+            
+            self._queue_row(self._metric_buf, (
+                user_id,
+                current_time,
+                *[getattr(system_data, key) or 0 for key in _METRIC_KEYS],
+                1 if system_data.network_available else 0,
+                system_data.battery_percent,
+                1 if system_data.power_connected else 0
+            ))
+            
+            # Update pending sync count
+            self.pending_sync_count += 1
+            
+            logger.debug("Session data queued for local database")
+            self.data_saved.emit({
+                'eye_data': eye_data,
+                'system_data': system_data,
+                'timestamp': current_time
+            })
+            
         except Exception as e:
             logger.error(f"Failed to save session data: {e}")
     
-    def save_blink_event(self, user_id, session_id=None):
-        """Save individual blink event"""
+    def save_blink_event(self, user_id=None, session_id=None):
+        """Queue individual blink event for the next batched write (current user by default)"""
         try:
-            with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute('''
-                        INSERT INTO blink_events (user_id, session_id, timestamp)
-                        VALUES (?, ?, ?)
-                    ''', (user_id, session_id, datetime.now()))
-                    
-                    conn.commit()
-                    logger.debug("Blink event saved")
-                    
+            if user_id is None:
+                user_id = self._get_current_user_id()
+            
+            # Stored as integer unix milliseconds (no datetime/ISO formatting per blink)
+            self._queue_row(self._blink_buf, (user_id, session_id or 0, time.time_ns() // 1_000_000))
+            logger.debug("Blink event queued")
+            
         except Exception as e:
             logger.error(f"Failed to save blink event: {e}")
     
+    def _queue_row(self, buffer, row):
+        """Append a row to a write buffer, flushing early if the batch is full"""
+        with self._buffer_lock:
+            buffer.append(row)
+            pending = len(self._metric_buf) + len(self._blink_buf)
+        
+        if pending >= FLUSH_BATCH_SIZE:
+            self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Hand buffered rows to a thread pool worker, keeping disk I/O off the GUI thread"""
+        with self._buffer_lock:
+            if self._flush_scheduled or not (self._metric_buf or self._blink_buf):
+                return
+            self._flush_scheduled = True
+        
+        QThreadPool.globalInstance().start(_FlushTask(self))
+    
+    def _flush(self):
+        """Write all buffered rows to the database in a single transaction"""
+        with self._buffer_lock:
+            metric_rows = list(self._metric_buf)
+            blink_rows = list(self._blink_buf)
+            self._metric_buf.clear()
+            self._blink_buf.clear()
+        
+        if not metric_rows and not blink_rows:
+            return
+        
+        try:
+            with self.db_lock:
+                self._cursor.execute('BEGIN IMMEDIATE')
+                try:
+                    if metric_rows:
+                        self._cursor.executemany(_SQL_INSERT_METRIC, metric_rows)
+                    if blink_rows:
+                        self._cursor.executemany(_SQL_INSERT_BLINK, blink_rows)
+                    self._cursor.execute('COMMIT')
+                except Exception:
+                    self._cursor.execute('ROLLBACK')
+                    raise
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Flushed %d metric rows and %d blink events", len(metric_rows), len(blink_rows))
+            self.data_flushed.emit(len(metric_rows) + len(blink_rows))
+            
+        except Exception as e:
+            logger.error(f"Failed to flush buffered data: {e}")
+            
+            # Put the rows back so the next flush retries them
+            with self._buffer_lock:
+                self._metric_buf.extendleft(reversed(metric_rows))
+                self._blink_buf.extendleft(reversed(blink_rows))
+    
     def start_eye_session(self, user_id):
         """Start a new eye tracking session"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute('''
-                        INSERT INTO eye_sessions (user_id, session_start)
-                        VALUES (?, ?)
-                    ''', (user_id, datetime.now()))
-                    
-                    session_id = cursor.lastrowid
-                    conn.commit()
-                    
-                    logger.info(f"Started eye tracking session {session_id} for user {user_id}")
-                    return session_id
+                cursor = self._cursor
+                
+                cursor.execute('''
+                    INSERT INTO eye_sessions (user_id, session_start)
+                    VALUES (?, ?)
+                ''', (user_id, datetime.now()))
+                
+                session_id = cursor.lastrowid
+                
+                logger.info(f"Started eye tracking session {session_id} for user {user_id}")
+                return session_id
                     
         except Exception as e:
             logger.error(f"Failed to start eye session: {e}")
@@ -206,25 +439,23 @@ class DataManager(QObject):
         """End eye tracking session with summary data"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Determine eye strain level
-                    if blinks_per_minute < 10:
-                        strain_level = 'high'
-                    elif blinks_per_minute < 15:
-                        strain_level = 'moderate'
-                    else:
-                        strain_level = 'normal'
-                    
-                    cursor.execute('''
-                        UPDATE eye_sessions 
-                        SET session_end = ?, total_blinks = ?, blinks_per_minute = ?, eye_strain_level = ?
-                        WHERE id = ?
-                    ''', (datetime.now(), total_blinks, blinks_per_minute, strain_level, session_id))
-                    
-                    conn.commit()
-                    logger.info(f"Ended eye tracking session {session_id}")
+                cursor = self._cursor
+                
+                # Determine eye strain level
+                if blinks_per_minute < 10:
+                    strain_level = 'high'
+                elif blinks_per_minute < 15:
+                    strain_level = 'moderate'
+                else:
+                    strain_level = 'normal'
+                
+                cursor.execute('''
+                    UPDATE eye_sessions 
+                    SET session_end = ?, total_blinks = ?, blinks_per_minute = ?, eye_strain_level = ?
+                    WHERE id = ?
+                ''', (datetime.now(), total_blinks, blinks_per_minute, strain_level, session_id))
+                
+                logger.info(f"Ended eye tracking session {session_id}")
                     
         except Exception as e:
             logger.error(f"Failed to end eye session: {e}")
@@ -233,47 +464,26 @@ class DataManager(QObject):
         """Get session statistics for the last N days"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cutoff_date = datetime.now() - timedelta(days=days)
-                    
-                    # Get eye tracking stats
-                    cursor.execute('''
-                        SELECT 
-                            COUNT(*) as session_count,
-                            AVG(total_blinks) as avg_blinks,
-                            AVG(blinks_per_minute) as avg_bpm,
-                            SUM(CASE WHEN eye_strain_level = 'high' THEN 1 ELSE 0 END) as high_strain_sessions
-                        FROM eye_sessions 
-                        WHERE user_id = ? AND session_start >= ?
-                    ''', (user_id, cutoff_date))
-                    
-                    eye_stats = cursor.fetchone()
-                    
-                    # Get system performance averages
-                    cursor.execute('''
-                        SELECT 
-                            AVG(cpu_percent) as avg_cpu,
-                            AVG(memory_percent) as avg_memory
-                        FROM system_metrics 
-                        WHERE user_id = ? AND timestamp >= ?
-                    ''', (user_id, cutoff_date))
-                    
-                    system_stats = cursor.fetchone()
-                    
-                    return {
-                        'eye_stats': {
-                            'session_count': eye_stats[0] or 0,
-                            'avg_blinks': eye_stats[1] or 0,
-                            'avg_bpm': eye_stats[2] or 0,
-                            'high_strain_sessions': eye_stats[3] or 0
-                        },
-                        'system_stats': {
-                            'avg_cpu': system_stats[0] or 0,
-                            'avg_memory': system_stats[1] or 0
-                        }
+                cutoff_date = datetime.now() - timedelta(days=days)
+                
+                # Eye tracking stats and system performance averages in one round trip
+                self._cursor.execute(_SQL_SESSION_STATS, {'user_id': user_id, 'cutoff': cutoff_date})
+                
+                (session_count, avg_blinks, avg_bpm, high_strain_sessions,
+                 avg_cpu, avg_memory) = self._cursor.fetchone()
+                
+                return {
+                    'eye_stats': {
+                        'session_count': session_count or 0,
+                        'avg_blinks': avg_blinks or 0,
+                        'avg_bpm': avg_bpm or 0,
+                        'high_strain_sessions': high_strain_sessions or 0
+                    },
+                    'system_stats': {
+                        'avg_cpu': avg_cpu or 0,
+                        'avg_memory': avg_memory or 0
                     }
+                }
                     
         except Exception as e:
             logger.error(f"Failed to get session stats: {e}")
@@ -288,7 +498,19 @@ class DataManager(QObject):
         self.is_syncing = True
         self.sync_status_changed.emit("Syncing...")
         
+        # Run the sync off the GUI thread; signals are queued back to it
+        QThreadPool.globalInstance().start(_SyncTask(self))
+    
+    def _run_sync(self):
+        """Sync body (runs on a thread pool worker)"""
         try:
+            # Flush buffered rows so they are included in this pass
+            self._flush()
+            
+            # Only rows that exist now are part of this pass; rows inserted
+            # during the upload stay unsynced for the next one
+            high_water = self._get_sync_high_water()
+            
             # Get unsynced records
             unsynced_count = self._get_unsynced_count()
             
@@ -302,7 +524,7 @@ class DataManager(QObject):
             success = self._simulate_cloud_sync()
             
             if success:
-                self._mark_records_as_synced()
+                self._mark_records_as_synced(high_water)
                 self.last_sync_time = datetime.now()
                 self.pending_sync_count = 0
                 
@@ -331,47 +553,43 @@ class DataManager(QObject):
         """Get count of unsynced records"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute('SELECT COUNT(*) FROM system_metrics WHERE synced = 0')
-                    metrics_count = cursor.fetchone()[0]
-                    
-                    cursor.execute('SELECT COUNT(*) FROM eye_sessions WHERE synced = 0')
-                    sessions_count = cursor.fetchone()[0]
-                    
-                    cursor.execute('SELECT COUNT(*) FROM blink_events WHERE synced = 0')
-                    blinks_count = cursor.fetchone()[0]
-                    
-                    return metrics_count + sessions_count + blinks_count
-                    
+                self._cursor.execute(_SQL_UNSYNCED_TOTAL)
+                return self._cursor.fetchone()[0] or 0
+                
         except Exception as e:
             logger.error(f"Failed to get unsynced count: {e}")
             return 0
     
     def _simulate_cloud_sync(self):
         """Simulate cloud synchronization (placeholder)"""
-        import time
         import random
         
-        # Simulate network delay
-        time.sleep(1)
+        # Simulate network delay (set WELLNESS_FAKE_SYNC_DELAY_MS=0 to skip, e.g. in tests)
+        delay_ms = float(os.environ.get("WELLNESS_FAKE_SYNC_DELAY_MS", "1000"))
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
         
         # Simulate occasional failures (10% chance)
         return random.random() > 0.1
     
-    def _mark_records_as_synced(self):
-        """Mark all unsynced records as synced"""
+    def _get_sync_high_water(self):
+        """Get the highest row id of each synced table"""
+        with self.db_lock:
+            self._cursor.execute(_SQL_SYNC_HIGH_WATER)
+            return self._cursor.fetchone()
+    
+    def _mark_records_as_synced(self, high_water):
+        """Mark unsynced records up to the given row ids as synced"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute('UPDATE system_metrics SET synced = 1 WHERE synced = 0')
-                    cursor.execute('UPDATE eye_sessions SET synced = 1 WHERE synced = 0')
-                    cursor.execute('UPDATE blink_events SET synced = 1 WHERE synced = 0')
-                    
-                    conn.commit()
+                self._cursor.execute('BEGIN IMMEDIATE')
+                try:
+                    for sql, max_id in zip(_SQL_MARK_SYNCED, high_water):
+                        self._cursor.execute(sql, (max_id,))
+                    self._cursor.execute('COMMIT')
+                except Exception:
+                    self._cursor.execute('ROLLBACK')
+                    raise
                     
         except Exception as e:
             logger.error(f"Failed to mark records as synced: {e}")
@@ -380,15 +598,13 @@ class DataManager(QObject):
         """Log sync operation result"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute('''
-                        INSERT INTO sync_log (sync_time, records_synced, success, error_message)
-                        VALUES (?, ?, ?, ?)
-                    ''', (datetime.now(), records_synced, 1 if success else 0, error_message))
-                    
-                    conn.commit()
+                cursor = self._cursor
+                
+                cursor.execute('''
+                    INSERT INTO sync_log (sync_time, records_synced, success, error_message)
+                    VALUES (?, ?, ?, ?)
+                ''', (datetime.now(), records_synced, 1 if success else 0, error_message))
+                
                     
         except Exception as e:
             logger.error(f"Failed to log sync result: {e}")
@@ -399,13 +615,33 @@ class DataManager(QObject):
         return "demo_user"
     
     def save_pending_data(self):
-        """Save any pending data before shutdown"""
+        """Save any pending data and close the database before shutdown"""
+        if self._conn is None:
+            return
+        
         try:
+            self.flush_timer.stop()
+            self.sync_timer.stop()
+            
+            # Let an in-flight sync or background flush finish with the connection
+            if self.is_syncing or self._flush_scheduled:
+                QThreadPool.globalInstance().waitForDone(5000)
+            
+            # Write out anything still sitting in the buffers
+            self._flush()
+            
             # Force sync any remaining data
             if self.pending_sync_count > 0:
                 logger.info(f"Saving {self.pending_sync_count} pending records")
                 # In production, might save to a backup file or queue for next startup
-                
+            
+            # Hand the connection back; the last user checkpoints and closes it
+            with self.db_lock:
+                self._cursor.close()
+            self._conn = None
+            self._cursor = None
+            release_connection(self.db_path)
+            
         except Exception as e:
             logger.error(f"Error saving pending data: {e}")
     
@@ -413,32 +649,18 @@ class DataManager(QObject):
         """Get database statistics"""
         try:
             with self.db_lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Get table counts
-                    cursor.execute('SELECT COUNT(*) FROM eye_sessions')
-                    sessions_count = cursor.fetchone()[0]
-                    
-                    cursor.execute('SELECT COUNT(*) FROM system_metrics')
-                    metrics_count = cursor.fetchone()[0]
-                    
-                    cursor.execute('SELECT COUNT(*) FROM blink_events')
-                    blinks_count = cursor.fetchone()[0]
-                    
-                    # Get unsynced counts
-                    cursor.execute('SELECT COUNT(*) FROM system_metrics WHERE synced = 0')
-                    unsynced_metrics = cursor.fetchone()[0]
-                    
-                    return {
-                        'total_sessions': sessions_count,
-                        'total_metrics': metrics_count,
-                        'total_blinks': blinks_count,
-                        'unsynced_count': unsynced_metrics,
-                        'last_sync': self.last_sync_time,
-                        'database_size': os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
-                    }
-                    
+                self._cursor.execute(_SQL_TABLE_COUNTS)
+                sessions_count, metrics_count, blinks_count, unsynced_metrics = self._cursor.fetchone()
+                
+                return {
+                    'total_sessions': sessions_count,
+                    'total_metrics': metrics_count,
+                    'total_blinks': blinks_count,
+                    'unsynced_count': unsynced_metrics,
+                    'last_sync': self.last_sync_time,
+                    'database_size': os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+                }
+                
         except Exception as e:
             logger.error(f"Failed to get database stats: {e}")
             return None
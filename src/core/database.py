@@ -0,0 +1,83 @@
+"""
+Database - Shared SQLite connections for the core managers
+"""
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Resolved database path -> [connection, lock, reference count]
+_connections = {}
+_registry_lock = threading.Lock()
+
+def _open_connection(path):
+    """Open a connection configured for shared, multi-threaded use"""
+    # Autocommit mode; batched writes manage their own transactions
+    conn = sqlite3.connect(
+        path,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256
+    )
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    return conn
+
+def acquire_connection(db_path):
+    """
+    Get the shared connection for a database file
+    
+    Every manager working on the same file gets the same connection and
+    the same lock, which must be held around any use of the connection.
+    
+    Args:
+        db_path (str or Path): Database file path
+        
+    Returns:
+        tuple: (sqlite3.Connection, threading.Lock)
+    """
+    key = str(Path(db_path).resolve())
+    
+    with _registry_lock:
+        entry = _connections.get(key)
+        if entry is None:
+            entry = _connections[key] = [_open_connection(key), threading.Lock(), 0]
+            logger.info(f"Opened database connection: {key}")
+        
+        entry[2] += 1
+        return entry[0], entry[1]
+
+def release_connection(db_path):
+    """
+    Release one reference to a shared connection
+    
+    The last release checkpoints the WAL, refreshes planner statistics
+    and closes the connection.
+    
+    Args:
+        db_path (str or Path): Database file path
+    """
+    key = str(Path(db_path).resolve())
+    
+    with _registry_lock:
+        entry = _connections.get(key)
+        if entry is None:
+            return
+        
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        
+        del _connections[key]
+    
+    conn, lock, _ = entry
+    with lock:
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        conn.execute('PRAGMA optimize')
+        conn.close()
+    
+    logger.info(f"Closed database connection: {key}")
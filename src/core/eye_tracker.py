@@ -2,16 +2,62 @@
 Eye Tracker - Monitors eye blinks using computer vision
 """
 import logging
+import sys
 import cv2
+import numpy as np
 import time
 import threading
-from datetime import datetime, timedelta
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+from collections import deque
+from typing import NamedTuple, Optional
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer
 
 logger = logging.getLogger(__name__)
 
+# Window of recent blinks kept for rate calculation, in seconds
+BLINK_HISTORY_WINDOW = 5 * 60
+
+# Simulated blink cadence when no camera is available, in milliseconds
+SIMULATION_BLINK_INTERVAL_MS = 5000
+
+# Longest stop() waits for the tracking loop to leave read()/process(), in seconds;
+# the camera paces the loop, so it normally returns within one frame
+TRACKING_STOP_TIMEOUT = 0.5
+
+# FaceMesh landmark indices per eye, ordered p1..p6 for the EAR formula
+LEFT_EYE_LANDMARKS = (33, 160, 158, 133, 153, 144)
+RIGHT_EYE_LANDMARKS = (362, 385, 387, 263, 373, 380)
+EYE_LANDMARKS = LEFT_EYE_LANDMARKS + RIGHT_EYE_LANDMARKS
+
+# Raw capture format requested from the camera
+_YUYV_FOURCC = cv2.VideoWriter_fourcc(*'YUYV')
+
+# Eye Aspect Ratio below which the eye is considered closed
+EAR_CLOSED_THRESHOLD = 0.21
+
+def eye_aspect_ratio(points):
+    """Compute the Eye Aspect Ratio for an (..., 6, 2) array of eye landmarks"""
+    points = np.asarray(points, dtype=np.float64)
+    
+    # Distances p2-p6, p3-p5 and p1-p4 for every eye at once
+    vertical = np.linalg.norm(points[..., [1, 2], :] - points[..., [5, 4], :], axis=-1).sum(axis=-1)
+    horizontal = np.linalg.norm(points[..., 0, :] - points[..., 3, :], axis=-1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ear = vertical / (2.0 * horizontal)
+    return np.where(horizontal > 0, ear, 0.0)
+
+class BlinkData(NamedTuple):
+    """Immutable snapshot of the current tracking session"""
+    total_blinks: int
+    blinks_per_minute: float
+    session_duration: str
+    last_blink: Optional[float]  # time.monotonic() seconds
+    is_tracking: bool
+    camera_available: bool
+    simulation_mode: bool
+
 class EyeTracker(QObject):
-    """Eye tracking system using OpenCV and face detection"""
+    """Eye tracking system using OpenCV capture and MediaPipe face landmarks"""
     
     # Signals
     blink_detected = pyqtSignal()
@@ -25,24 +71,31 @@ class EyeTracker(QObject):
         self.is_running = False
         self.camera_available = False
         
-        # Blink data
+        # Blink data (times are time.monotonic() seconds)
         self.total_blinks = 0
         self.session_start_time = None
         self.last_blink_time = None
-        self.blink_history = []
+        self.blink_history = deque()
         
         # Camera and detection
         self.camera = None
-        self.face_cascade = None
-        self.eye_cascade = None
+        self.frame_size = None
+        self.raw_yuyv = False  # camera delivers unconverted YUYV buffers
+        self.face_mesh = None
         
-        # Threading
+        # Threading; the loop owns the camera and model while it runs, since
+        # VideoCapture and FaceMesh must not be used from two threads at once
         self.tracking_thread = None
         self.should_stop = False
+        self._loop_lock = threading.Lock()
+        self._loop_active = False       # loop has not yet returned
+        self._release_on_exit = False   # stop() gave up waiting; loop frees its resources
         
         # Simulation mode (when camera not available)
         self.simulation_mode = False
         self.simulation_timer = QTimer()
+        self.simulation_timer.setInterval(SIMULATION_BLINK_INTERVAL_MS)
+        self.simulation_timer.setTimerType(Qt.CoarseTimer)
         self.simulation_timer.timeout.connect(self._simulate_blink)
         
         logger.info("Eye tracker initialized")
@@ -55,31 +108,42 @@ class EyeTracker(QObject):
         logger.info("Starting eye tracker")
         
         try:
-            # Try to initialize camera and cascades
-            if self._initialize_camera() and self._load_cascades():
-                self.camera_available = True
-                self.simulation_mode = False
-                logger.info("Camera available, using real tracking")
-            else:
+            # Try to initialize camera and landmark model
+            if self._loop_active:
+                # A stopped loop is still blocked in the driver and holds the camera
+                self.camera_available = False
+                self.simulation_mode = True
+                logger.warning("Previous tracking loop still running, using simulation mode")
+            elif not self._initialize_camera():
                 self.camera_available = False
                 self.simulation_mode = True
                 logger.info("Camera not available, using simulation mode")
+            elif not self._load_face_mesh():
+                # A camera without the landmark model cannot track; free it for other apps
+                self._release_camera()
+                self.camera_available = False
+                self.simulation_mode = True
+                logger.error("Landmark model unavailable, falling back to simulation mode")
+            else:
+                self.camera_available = True
+                self.simulation_mode = False
+                logger.info("Camera available, using real tracking")
             
             # Reset tracking data
             self.total_blinks = 0
-            self.session_start_time = datetime.now()
-            self.blink_history = []
-            self.should_stop = False
+            self.session_start_time = time.monotonic()
+            self.blink_history = deque()
             
             # Start tracking
             self.is_running = True
             
             if self.simulation_mode:
-                # Start simulation timer (random blinks every 3-8 seconds)
-                import random
-                self.simulation_timer.start(random.randint(3000, 8000))
+                # Start simulation timer (one blink every 5 seconds)
+                self.simulation_timer.start()
             else:
                 # Start real tracking thread
+                self.should_stop = False
+                self._loop_active = True
                 self.tracking_thread = threading.Thread(target=self._tracking_loop)
                 self.tracking_thread.daemon = True
                 self.tracking_thread.start()
@@ -106,14 +170,16 @@ class EyeTracker(QObject):
             if self.simulation_mode:
                 self.simulation_timer.stop()
             
-            # Stop camera
-            if self.camera:
-                self.camera.release()
-                self.camera = None
-            
-            # Wait for thread to finish
+            # Let the loop leave read()/process() before freeing what it uses
             if self.tracking_thread and self.tracking_thread.is_alive():
-                self.tracking_thread.join(timeout=2.0)
+                self.tracking_thread.join(timeout=TRACKING_STOP_TIMEOUT)
+            
+            with self._loop_lock:
+                if self._loop_active:
+                    self._release_on_exit = True
+                    logger.warning("Tracking loop still busy; it will release the camera when it returns")
+                else:
+                    self._release_tracking_resources()
             
             self.tracking_stopped.emit()
             logger.info("Eye tracking stopped")
@@ -124,8 +190,19 @@ class EyeTracker(QObject):
     def _initialize_camera(self):
         """Initialize camera for eye tracking"""
         try:
-            # Try to open default camera
-            self.camera = cv2.VideoCapture(0)
+            # Try to open default camera with the platform's low-latency backend
+            if sys.platform == 'win32':
+                backend = cv2.CAP_DSHOW
+            elif sys.platform.startswith('linux'):
+                backend = cv2.CAP_V4L2
+            else:
+                backend = cv2.CAP_ANY
+            self.camera = cv2.VideoCapture(0, backend)
+            
+            if not self.camera.isOpened() and backend != cv2.CAP_ANY:
+                # Fall back to OpenCV's own backend choice
+                self.camera.release()
+                self.camera = cv2.VideoCapture(0)
             
             if not self.camera.isOpened():
                 logger.warning("Could not open camera")
@@ -136,6 +213,19 @@ class EyeTracker(QObject):
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
             self.camera.set(cv2.CAP_PROP_FPS, 30)
             
+            # Keep a single queued frame so read() always returns the freshest one
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
+            # Ask for the native YUYV stream so the driver skips its own BGR conversion;
+            # only take raw buffers if the camera actually agreed (MJPG ones are compressed)
+            self.camera.set(cv2.CAP_PROP_FOURCC, _YUYV_FOURCC)
+            self.raw_yuyv = int(self.camera.get(cv2.CAP_PROP_FOURCC)) == _YUYV_FOURCC
+            self.camera.set(cv2.CAP_PROP_CONVERT_RGB, 0 if self.raw_yuyv else 1)
+            self.frame_size = (
+                int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            )
+            
             logger.info("Camera initialized successfully")
             return True
             
@@ -143,22 +233,44 @@ class EyeTracker(QObject):
             logger.error(f"Failed to initialize camera: {e}")
             return False
     
-    def _load_cascades(self):
-        """Load OpenCV cascade classifiers"""
+    def _release_camera(self):
+        """Release the capture device if one is open"""
+        if self.camera:
+            self.camera.release()
+            self.camera = None
+    
+    def _release_tracking_resources(self):
+        """Release the camera and close the landmark model"""
+        self._release_camera()
+        if self.face_mesh:
+            self.face_mesh.close()
+            self.face_mesh = None
+    
+    def _load_face_mesh(self):
+        """Load MediaPipe FaceMesh landmark model"""
         try:
-            # Load pre-trained cascade classifiers
-            self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-            self.eye_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
+            import mediapipe as mp
             
-            if self.face_cascade.empty() or self.eye_cascade.empty():
-                logger.error("Failed to load cascade classifiers")
-                return False
+            # Video mode: the face detector only reruns when landmark tracking is lost
+            self.face_mesh = mp.solutions.face_mesh.FaceMesh(
+                static_image_mode=False,
+                max_num_faces=1,
+                refine_landmarks=False,
+                min_tracking_confidence=0.5
+            )
             
-            logger.info("Cascade classifiers loaded successfully")
+            logger.info("FaceMesh landmark model loaded successfully")
             return True
             
+        except ImportError:
+            logger.error("mediapipe not installed, landmark tracking unavailable")
+            return False
+        except AttributeError:
+            # mediapipe 0.10.30 and later no longer ship the legacy solutions API
+            logger.error("Installed mediapipe has no FaceMesh solution; install mediapipe<0.10.30")
+            return False
         except Exception as e:
-            logger.error(f"Failed to load cascades: {e}")
+            logger.error(f"Failed to load FaceMesh: {e}")
             return False
     
     def _tracking_loop(self):
@@ -167,35 +279,38 @@ class EyeTracker(QObject):
         
         # Eye state tracking
         eye_closed_frames = 0
-        blink_threshold = 5  # Number of consecutive frames with closed eyes to count as blink
+        blink_threshold = 2  # Number of consecutive frames with low EAR to count as blink
+        
+        # Run resize and color conversion through OpenCL when a device is present
+        use_opencl = cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(use_opencl)
+        logger.info(f"OpenCL acceleration {'enabled' if use_opencl else 'unavailable'}")
         
         try:
+            # read() blocks until the next frame, so the camera paces the loop
             while not self.should_stop and self.camera and self.camera.isOpened():
                 ret, frame = self.camera.read()
                 
                 if not ret:
                     break
                 
-                # Convert to grayscale
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                # FaceMesh expects RGB input as a host array
+                rgb = self._frame_to_rgb(frame, use_opencl)
+                results = self.face_mesh.process(rgb)
                 
-                # Detect faces
-                faces = self.face_cascade.detectMultiScale(gray, 1.3, 5)
+                # No face in view is not a closed eye; keep the current state
+                if not results.multi_face_landmarks:
+                    continue
                 
-                eyes_detected = False
-                
-                for (x, y, w, h) in faces:
-                    roi_gray = gray[y:y+h, x:x+w]
-                    
-                    # Detect eyes in face region
-                    eyes = self.eye_cascade.detectMultiScale(roi_gray)
-                    
-                    if len(eyes) >= 2:  # Both eyes detected
-                        eyes_detected = True
-                        break
+                # Scale normalized landmarks to pixels so EAR is aspect-correct
+                height, width = rgb.shape[:2]
+                landmarks = results.multi_face_landmarks[0].landmark
+                points = np.array([(landmarks[i].x, landmarks[i].y) for i in EYE_LANDMARKS])
+                points *= (width, height)
+                ear = eye_aspect_ratio(points.reshape(2, 6, 2)).mean()
                 
                 # Track eye state
-                if not eyes_detected:
+                if ear < EAR_CLOSED_THRESHOLD:
                     eye_closed_frames += 1
                 else:
                     if eye_closed_frames >= blink_threshold:
@@ -203,64 +318,81 @@ class EyeTracker(QObject):
                         self._record_blink()
                     eye_closed_frames = 0
                 
-                # Small delay to reduce CPU usage
-                time.sleep(0.033)  # ~30 FPS
-                
         except Exception as e:
             logger.error(f"Error in tracking loop: {e}")
         
+        finally:
+            with self._loop_lock:
+                self._loop_active = False
+                if self._release_on_exit:
+                    self._release_on_exit = False
+                    self._release_tracking_resources()
+        
         logger.info("Tracking loop ended")
     
+    def _frame_to_rgb(self, frame, use_opencl):
+        """Convert a captured frame to a half-size RGB array for the landmark model"""
+        if not self.raw_yuyv or (frame.ndim == 3 and frame.shape[2] == 3):
+            # BGR from a camera that refused YUYV, or a backend that converted anyway;
+            # halve before converting
+            source = cv2.UMat(frame) if use_opencl else frame
+            small = cv2.resize(source, (0, 0), fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+            rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+        else:
+            # Raw YUYV buffer: a single conversion straight to RGB, then halve
+            width, height = self.frame_size
+            yuyv = frame.reshape(height, width, 2)
+            source = cv2.UMat(yuyv) if use_opencl else yuyv
+            full = cv2.cvtColor(source, cv2.COLOR_YUV2RGB_YUYV)
+            rgb = cv2.resize(full, (0, 0), fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        
+        return rgb.get() if use_opencl else rgb
+    
     def _simulate_blink(self):
         """Simulate a blink (for demo purposes when camera not available)"""
         self._record_blink()
-        
-        # Schedule next simulation blink
-        import random
-        self.simulation_timer.start(random.randint(3000, 8000))
     
     def _record_blink(self):
         """Record a detected blink"""
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         self.total_blinks += 1
         self.last_blink_time = current_time
         self.blink_history.append(current_time)
         
         # Keep only recent blinks (last 5 minutes for rate calculation)
-        cutoff_time = current_time - timedelta(minutes=5)
-        self.blink_history = [t for t in self.blink_history if t > cutoff_time]
+        cutoff_time = current_time - BLINK_HISTORY_WINDOW
+        while self.blink_history and self.blink_history[0] <= cutoff_time:
+            self.blink_history.popleft()
         
         self.blink_detected.emit()
-        logger.debug(f"Blink detected. Total: {self.total_blinks}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Blink detected. Total: %d", self.total_blinks)
     
     def get_current_data(self):
         """Get current tracking data"""
-        current_time = datetime.now()
-        
-        # Calculate session duration
-        if self.session_start_time:
-            session_duration = current_time - self.session_start_time
-            duration_str = str(session_duration).split('.')[0]  # Remove microseconds
+        if self.session_start_time is not None:
+            elapsed = time.monotonic() - self.session_start_time
+            
+            # Format session duration as HH:MM:SS
+            secs = int(elapsed)
+            duration_str = f"{secs // 3600:02d}:{(secs // 60) % 60:02d}:{secs % 60:02d}"
+            
+            # Calculate blinks per minute
+            blinks_per_minute = self.total_blinks / max(1, elapsed / 60)
         else:
             duration_str = "00:00:00"
-        
-        # Calculate blinks per minute
-        if self.session_start_time:
-            session_minutes = max(1, (current_time - self.session_start_time).total_seconds() / 60)
-            blinks_per_minute = self.total_blinks / session_minutes
-        else:
             blinks_per_minute = 0
         
-        return {
-            'total_blinks': self.total_blinks,
-            'blinks_per_minute': blinks_per_minute,
-            'session_duration': duration_str,
-            'last_blink': self.last_blink_time,
-            'is_tracking': self.is_running,
-            'camera_available': self.camera_available,
-            'simulation_mode': self.simulation_mode
-        }
+        return BlinkData(
+            total_blinks=self.total_blinks,
+            blinks_per_minute=blinks_per_minute,
+            session_duration=duration_str,
+            last_blink=self.last_blink_time,
+            is_tracking=self.is_running,
+            camera_available=self.camera_available,
+            simulation_mode=self.simulation_mode
+        )
     
     def is_camera_available(self):
         """Check if camera is available"""
@@ -268,11 +400,11 @@ class EyeTracker(QObject):
     
     def get_blink_history(self):
         """Get recent blink history"""
-        return self.blink_history.copy()
+        return list(self.blink_history)
     
     def reset_session(self):
         """Reset current session data"""
         self.total_blinks = 0
-        self.session_start_time = datetime.now()
-        self.blink_history = []
+        self.session_start_time = time.monotonic()
+        self.blink_history = deque()
         logger.info("Session data reset")
@@ -7,15 +7,35 @@ import time
 import threading
 import socket
 from datetime import datetime
+from typing import NamedTuple, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# Seconds between remote reachability probes
+NETWORK_PROBE_INTERVAL = 30.0
+
+# Seconds between disk usage and process count refreshes
+SLOW_METRICS_INTERVAL = 10.0
+
+class SystemMetrics(NamedTuple):
+    """Immutable snapshot of system metrics; replaced, never mutated"""
+    cpu_percent: float = 0.0
+    memory_percent: float = 0.0
+    memory_used_mb: float = 0.0
+    memory_total_mb: float = 0.0
+    disk_usage_percent: float = 0.0
+    network_available: bool = False
+    battery_percent: Optional[float] = None
+    power_connected: Optional[bool] = None
+    process_count: int = 0
+    boot_time: Optional[datetime] = None
+
 class SystemMonitor(QObject):
     """System performance monitoring using psutil"""
     
     # Signals
-    metrics_updated = pyqtSignal(dict)
+    metrics_updated = pyqtSignal(object)  # SystemMetrics, only when it changed
     monitoring_started = pyqtSignal()
     monitoring_stopped = pyqtSignal()
     
@@ -26,22 +46,20 @@ class SystemMonitor(QObject):
         self.is_running = False
         self.should_stop = False
         
-        # Monitoring thread
+        # Monitoring threads
         self.monitoring_thread = None
+        self.network_thread = None
+        self._network_wakeup = threading.Event()
         
-        # Current metrics
-        self.current_metrics = {
-            'cpu_percent': 0.0,
-            'memory_percent': 0.0,
-            'memory_used_mb': 0.0,
-            'memory_total_mb': 0.0,
-            'disk_usage_percent': 0.0,
-            'network_available': False,
-            'battery_percent': None,
-            'power_connected': None,
-            'process_count': 0,
-            'boot_time': None
-        }
+        # Last refresh of slow-changing metrics (monotonic seconds)
+        self._slow_metrics_time = float('-inf')
+        
+        # Last emitted snapshot, so unchanged ticks are not re-emitted
+        self._prev_metrics = None
+        
+        # Current metrics; writers swap in a new snapshot under the lock
+        self.current_metrics = SystemMetrics()
+        self._metrics_lock = threading.Lock()
         
         # Initialize system info
         self._get_system_info()
@@ -58,12 +76,19 @@ class SystemMonitor(QObject):
         try:
             self.should_stop = False
             self.is_running = True
+            self._prev_metrics = None
             
             # Start monitoring thread
             self.monitoring_thread = threading.Thread(target=self._monitoring_loop)
             self.monitoring_thread.daemon = True
             self.monitoring_thread.start()
             
+            # Network probe runs on its own cadence so a slow network never stalls metrics
+            self._network_wakeup.clear()
+            self.network_thread = threading.Thread(target=self._network_loop)
+            self.network_thread.daemon = True
+            self.network_thread.start()
+            
             self.monitoring_started.emit()
             logger.info("System monitoring started")
             
@@ -82,10 +107,13 @@ class SystemMonitor(QObject):
         try:
             self.should_stop = True
             self.is_running = False
+            self._network_wakeup.set()
             
-            # Wait for thread to finish
+            # Wait for threads to finish
             if self.monitoring_thread and self.monitoring_thread.is_alive():
                 self.monitoring_thread.join(timeout=2.0)
+            if self.network_thread and self.network_thread.is_alive():
+                self.network_thread.join(timeout=2.0)
             
             self.monitoring_stopped.emit()
             logger.info("System monitoring stopped")
@@ -100,15 +128,13 @@ class SystemMonitor(QObject):
         try:
             while not self.should_stop:
                 # Update all metrics
-                self._update_cpu_metrics()
-                self._update_memory_metrics()
-                self._update_disk_metrics()
-                self._update_network_status()
-                self._update_battery_metrics()
-                self._update_process_count()
+                self._snapshot()
                 
-                # Emit updated metrics
-                self.metrics_updated.emit(self.current_metrics.copy())
+                # Emit the snapshot only when something changed since the last tick
+                metrics = self.current_metrics
+                if metrics != self._prev_metrics:
+                    self._prev_metrics = metrics
+                    self.metrics_updated.emit(metrics)
                 
                 # Wait before next update
                 time.sleep(2.0)  # Update every 2 seconds
@@ -118,83 +144,77 @@ class SystemMonitor(QObject):
         
         logger.info("Monitoring loop ended")
     
-    def _update_cpu_metrics(self):
-        """Update CPU usage metrics"""
-        try:
-            # Get CPU percentage (non-blocking)
-            cpu_percent = psutil.cpu_percent(interval=None)
-            self.current_metrics['cpu_percent'] = cpu_percent
-            
-        except Exception as e:
-            logger.error(f"Error updating CPU metrics: {e}")
+    def _network_loop(self):
+        """Network probe loop (runs in separate thread)"""
+        while not self.should_stop:
+            self._update_network_status()
+            self._network_wakeup.wait(NETWORK_PROBE_INTERVAL)
     
-    def _update_memory_metrics(self):
-        """Update memory usage metrics"""
+    def _snapshot(self):
+        """Read all per-tick metrics in one pass and publish them together"""
         try:
-            # Get memory info
+            now = time.monotonic()
             memory = psutil.virtual_memory()
             
-            self.current_metrics['memory_percent'] = memory.percent
-            self.current_metrics['memory_used_mb'] = memory.used / (1024 * 1024)
-            self.current_metrics['memory_total_mb'] = memory.total / (1024 * 1024)
+            snapshot = {
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'memory_percent': memory.percent,
+                'memory_used_mb': memory.used / (1024 * 1024),
+                'memory_total_mb': memory.total / (1024 * 1024)
+            }
             
-        except Exception as e:
-            logger.error(f"Error updating memory metrics: {e}")
-    
-    def _update_disk_metrics(self):
-        """Update disk usage metrics"""
-        try:
-            # Get disk usage for root/C: drive
-            if hasattr(psutil, 'disk_usage'):
+            # Disk usage and process count change slowly; refresh them less often
+            if now - self._slow_metrics_time >= SLOW_METRICS_INTERVAL:
                 disk = psutil.disk_usage('/')
-                self.current_metrics['disk_usage_percent'] = (disk.used / disk.total) * 100
+                snapshot['disk_usage_percent'] = (disk.used / disk.total) * 100
+                snapshot['process_count'] = len(psutil.pids())
+                self._slow_metrics_time = now
             
-        except Exception as e:
-            logger.error(f"Error updating disk metrics: {e}")
-    
-    def _update_network_status(self):
-        """Update network connectivity status"""
-        try:
-            # Check if we can connect to a public DNS server
-            socket.setdefaulttimeout(3)
-            socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect(("8.8.8.8", 53))
-            self.current_metrics['network_available'] = True
-            
-        except socket.error:
-            self.current_metrics['network_available'] = False
-        except Exception as e:
-            logger.error(f"Error checking network status: {e}")
-            self.current_metrics['network_available'] = False
-    
-    def _update_battery_metrics(self):
-        """Update battery status (if available)"""
-        try:
             if hasattr(psutil, 'sensors_battery'):
                 battery = psutil.sensors_battery()
                 if battery:
-                    self.current_metrics['battery_percent'] = battery.percent
-                    self.current_metrics['power_connected'] = battery.power_plugged
+                    snapshot['battery_percent'] = battery.percent
+                    snapshot['power_connected'] = battery.power_plugged
                 else:
                     # Desktop/no battery
-                    self.current_metrics['battery_percent'] = None
-                    self.current_metrics['power_connected'] = True
+                    snapshot['battery_percent'] = None
+                    snapshot['power_connected'] = True
+            
+            self._update_metrics(**snapshot)
             
         except Exception as e:
-            logger.error(f"Error updating battery metrics: {e}")
+            logger.error(f"Error updating system metrics: {e}")
+    
+    def _update_metrics(self, **changes):
+        """Publish a new metrics snapshot with the given fields replaced"""
+        with self._metrics_lock:
+            self.current_metrics = self.current_metrics._replace(**changes)
     
-    def _update_process_count(self):
-        """Update running process count"""
+    def _update_network_status(self):
+        """Update network connectivity status"""
         try:
-            self.current_metrics['process_count'] = len(psutil.pids())
+            # No interface up besides loopback means offline; skip the remote probe
+            interfaces = psutil.net_if_stats()
+            if not any(stats.isup for name, stats in interfaces.items() if not name.startswith('lo')):
+                self._update_metrics(network_available=False)
+                return
             
+            # Check if we can connect to a public DNS server
+            with socket.create_connection(("8.8.8.8", 53), timeout=3):
+                pass
+            self._update_metrics(network_available=True)
+            
+        except socket.error:
+            self._update_metrics(network_available=False)
         except Exception as e:
-            logger.error(f"Error updating process count: {e}")
+            logger.error(f"Error checking network status: {e}")
+            self._update_metrics(network_available=False)
     
     def _get_system_info(self):
         """Get static system information"""
         try:
             # Get boot time
-            self.current_metrics['boot_time'] = datetime.fromtimestamp(psutil.boot_time())
+            self._update_metrics(boot_time=datetime.fromtimestamp(psutil.boot_time()))
             
             # Initial CPU reading (to enable non-blocking subsequent calls)
             psutil.cpu_percent(interval=1)
@@ -204,42 +224,43 @@ class SystemMonitor(QObject):
     
     def get_current_data(self):
         """Get current monitoring data"""
-        return self.current_metrics.copy()
+        return self.current_metrics
     
     def get_cpu_usage(self):
         """Get current CPU usage percentage"""
-        return self.current_metrics['cpu_percent']
+        return self.current_metrics.cpu_percent
     
     def get_memory_usage(self):
         """Get current memory usage info"""
         return {
-            'percent': self.current_metrics['memory_percent'],
-            'used_mb': self.current_metrics['memory_used_mb'],
-            'total_mb': self.current_metrics['memory_total_mb']
+            'percent': self.current_metrics.memory_percent,
+            'used_mb': self.current_metrics.memory_used_mb,
+            'total_mb': self.current_metrics.memory_total_mb
         }
     
     def get_network_status(self):
         """Get network connectivity status"""
-        return self.current_metrics['network_available']
+        return self.current_metrics.network_available
     
     def get_battery_info(self):
         """Get battery information"""
         return {
-            'percent': self.current_metrics['battery_percent'],
-            'power_connected': self.current_metrics['power_connected']
+            'percent': self.current_metrics.battery_percent,
+            'power_connected': self.current_metrics.power_connected
         }
     
     def get_system_uptime(self):
         """Get system uptime"""
-        if self.current_metrics['boot_time']:
-            uptime = datetime.now() - self.current_metrics['boot_time']
-            return str(uptime).split('.')[0]  # Remove microseconds
+        boot_time = self.current_metrics.boot_time
+        if boot_time:
+            secs = int((datetime.now() - boot_time).total_seconds())
+            return f"{secs // 3600:02d}:{(secs // 60) % 60:02d}:{secs % 60:02d}"
         return "Unknown"
     
     def get_power_impact_estimate(self):
         """Estimate power impact based on CPU and other metrics"""
         try:
-            cpu_impact = self.current_metrics['cpu_percent']
+            cpu_impact = self.current_metrics.cpu_percent
             
             # Simple estimation: high CPU = higher power impact
             if cpu_impact > 80:
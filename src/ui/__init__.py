@@ -1,17 +1,22 @@
 """
 UI Package - Contains all user interface components
 """
-# Import main UI components
-from .main_window import MainWindow
-from .auth_widget import AuthWidget
-from .dashboard_widget import DashboardWidget
-from .status_bar import CustomStatusBar
-from .theme import apply_dark_theme
+import importlib
 
-__all__ = [
-    'MainWindow',
-    'AuthWidget', 
-    'DashboardWidget',
-    'CustomStatusBar',
-    'apply_dark_theme'
-]
+# Main UI components, imported on first access so that loading one UI module
+# (e.g. the theme at startup) does not pull in the dashboard and OpenCV
+_EXPORTS = {
+    'MainWindow': '.main_window',
+    'AuthWidget': '.auth_widget',
+    'DashboardWidget': '.dashboard_widget',
+    'CustomStatusBar': '.status_bar',
+    'apply_dark_theme': '.theme'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """Import an exported component on first access"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
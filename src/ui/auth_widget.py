@@ -2,22 +2,40 @@ import logging
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QPushButton, QFrame, QSpacerItem, 
                             QSizePolicy, QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont, QPixmap, QIcon
 
-from core.auth_manager import AuthManager
+from ..core.auth_manager import AuthManager
 
 logger = logging.getLogger(__name__)
 
+class _AuthTask(QRunnable):
+    """Runs one authentication attempt on the global thread pool"""
+    
+    def __init__(self, widget, username, password):
+        super().__init__()
+        self.widget = widget
+        self.username = username
+        self.password = password
+    
+    def run(self):
+        try:
+            ok = self.widget.auth_manager.authenticate(self.username, self.password)
+            self.widget._auth_finished.emit(self.username, ok, "")
+        except Exception as e:
+            self.widget._auth_finished.emit(self.username, False, str(e))
+
 class AuthWidget(QWidget):
     # Signals
     login_successful = pyqtSignal(str)  # username
+    _auth_finished = pyqtSignal(str, bool, str)  # username, success, error (queued from worker)
     
     def __init__(self):
         super().__init__()
         
         # Auth manager
         self.auth_manager = AuthManager()
+        self.auth_pending = False
         
         # Initialize UI
         self.init_ui()
@@ -46,13 +64,6 @@ class AuthWidget(QWidget):
         container = QFrame()
         container.setFixedSize(400, 350)
         container.setObjectName("loginContainer")
-        container.setStyleSheet("""
-            QFrame#loginContainer {
-                background-color: #2b2b2b;
-                border: 1px solid #404040;
-                border-radius: 10px;
-            }
-        """)
         
         form_layout = QVBoxLayout(container)
         form_layout.setSpacing(20)
@@ -61,28 +72,19 @@ class AuthWidget(QWidget):
         # Title
         title_label = QLabel("Welcome Back")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("""
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        """)
+        title_label.setObjectName("titleLabel")
         form_layout.addWidget(title_label)
         
         # Subtitle
         subtitle_label = QLabel("Sign in to continue monitoring your wellness")
         subtitle_label.setAlignment(Qt.AlignCenter)
-        subtitle_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-            margin-bottom: 20px;
-        """)
+        subtitle_label.setObjectName("subtitleLabel")
         subtitle_label.setWordWrap(True)
         form_layout.addWidget(subtitle_label)
         
         # Username field
         username_label = QLabel("Username:")
-        username_label.setStyleSheet("color: #cccccc; font-weight: bold;")
+        username_label.setObjectName("fieldLabel")
         form_layout.addWidget(username_label)
         
         self.username_input = QLineEdit()
@@ -92,7 +94,7 @@ class AuthWidget(QWidget):
         
         # Password field
         password_label = QLabel("Password:")
-        password_label.setStyleSheet("color: #cccccc; font-weight: bold;")
+        password_label.setObjectName("fieldLabel")
         form_layout.addWidget(password_label)
         
         self.password_input = QLineEdit()
@@ -104,40 +106,21 @@ class AuthWidget(QWidget):
         # Login button
         self.login_button = QPushButton("Sign In")
         self.login_button.setFixedHeight(45)
-        self.login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2a82da;
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a92ea;
-            }
-            QPushButton:pressed {
-                background-color: #1a72ca;
-            }
-        """)
+        self.login_button.setObjectName("loginButton")
         form_layout.addWidget(self.login_button)
         
         # Status label
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("error", True)
         self.status_label.hide()
         form_layout.addWidget(self.status_label)
         
         # Demo credentials info
         demo_info = QLabel("Demo Credentials: admin / password")
         demo_info.setAlignment(Qt.AlignCenter)
-        demo_info.setStyleSheet("""
-            color: #808080;
-            font-size: 10px;
-            font-style: italic;
-            margin-top: 10px;
-        """)
+        demo_info.setObjectName("demoInfo")
         form_layout.addWidget(demo_info)
         
         # Center the container
@@ -150,6 +133,8 @@ class AuthWidget(QWidget):
     
     def setup_connections(self):
         """Setup signal connections"""
+        self._auth_finished.connect(self._on_auth_result)
+        
         self.login_button.clicked.connect(self.handle_login)
         self.username_input.returnPressed.connect(self.handle_login)
         self.password_input.returnPressed.connect(self.handle_login)
@@ -163,55 +148,62 @@ class AuthWidget(QWidget):
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
         
-        self.login_button.setEnabled(len(username) > 0 and len(password) > 0)
+        self.login_button.setEnabled(not self.auth_pending and len(username) > 0 and len(password) > 0)
     
     def handle_login(self):
         """Handle login attempt"""
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
         
+        if self.auth_pending:
+            return
+        
         if not username or not password:
             self.show_status("Please enter both username and password", error=True)
             return
         
         # Disable button during login
+        self.auth_pending = True
         self.login_button.setEnabled(False)
         self.login_button.setText("Signing In...")
         
-        try:
-            # Attempt authentication
-            if self.auth_manager.authenticate(username, password):
-                self.show_status("Login successful!", error=False)
-                
-                # Clear inputs
-                self.username_input.clear()
-                self.password_input.clear()
-                
-                # Emit success signal
-                QTimer.singleShot(500, lambda: self.login_successful.emit(username))
-                
-                logger.info(f"User {username} authenticated successfully")
-            else:
-                self.show_status("Invalid username or password", error=True)
-                logger.warning(f"Failed authentication attempt for user: {username}")
-                
-        except Exception as e:
-            self.show_status(f"Login error: {str(e)}", error=True)
-            logger.error(f"Authentication error: {e}")
+        # Hash and compare off the GUI thread; the result comes back via _auth_finished
+        QThreadPool.globalInstance().start(_AuthTask(self, username, password))
+    
+    def _on_auth_result(self, username, ok, error):
+        """Handle the outcome of a background authentication attempt"""
+        self.auth_pending = False
+        
+        if error:
+            self.show_status(f"Login error: {error}", error=True)
+            logger.error(f"Authentication error: {error}")
+        elif ok:
+            self.show_status("Login successful!", error=False)
+            
+            # Clear inputs
+            self.username_input.clear()
+            self.password_input.clear()
+            
+            # Emit success signal
+            QTimer.singleShot(500, lambda: self.login_successful.emit(username))
+            
+            logger.info(f"User {username} authenticated successfully")
+        else:
+            self.show_status("Invalid username or password", error=True)
+            logger.warning(f"Failed authentication attempt for user: {username}")
         
-        finally:
-            # Re-enable button
-            self.login_button.setText("Sign In")
-            self.update_login_button()
+        # Re-enable button
+        self.login_button.setText("Sign In")
+        self.update_login_button()
     
     def show_status(self, message, error=True):
         """Show status message"""
         self.status_label.setText(message)
         
-        if error:
-            self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-        else:
-            self.status_label.setStyleSheet("color: #4caf50; font-size: 11px;")
+        # Switch color through the stylesheet's [error] selector; repolish to apply
+        self.status_label.setProperty("error", error)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
         
         self.status_label.show()
         
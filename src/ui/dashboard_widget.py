@@ -1,35 +1,83 @@
 import logging
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QFrame, QGroupBox, QProgressBar,
-                            QGridLayout, QSplitter, QTextEdit, QSpacerItem,
+                            QSplitter, QTextEdit, QSpacerItem,
                             QSizePolicy)
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont, QPixmap
 
-from core.eye_tracker import EyeTracker
-from core.system_monitor import SystemMonitor
-from core.data_manager import DataManager
+from ..core.eye_tracker import EyeTracker
+from ..core.system_monitor import SystemMonitor
+from ..core.data_manager import DataManager
+from .stats_panel import StatsPanel
+from .theme import status_dot
 
 logger = logging.getLogger(__name__)
 
+# Dirty bits set by tracker signals and consumed by update_display
+_DIRTY_BLINKS = 0x1
+_DIRTY_SYSTEM = 0x2
+_DIRTY_ALL = _DIRTY_BLINKS | _DIRTY_SYSTEM
+
+# Window for coalescing bursts of tracker events into one repaint, in milliseconds
+_REPAINT_COALESCE_MS = 50
+
+# Blinks-per-minute band edges; bisect_right(bpm) indexes _STRAIN_STATES
+_STRAIN_THRESHOLDS = (10, 15)
+
+# Eye strain band -> (text, color); colors match the theme's QLabel state rules
+_STRAIN_STATES = (
+    ("High Strain", "#f44336"),
+    ("Moderate", "#ffeb3b"),
+    ("Normal", "#4caf50")
+)
+
+# Eye statistics panel rows
+_EYE_STAT_TITLES = ("Blinks/Min:", "Session Time:", "Eye Strain:")
+_STAT_BPM, _STAT_SESSION, _STAT_STRAIN = range(len(_EYE_STAT_TITLES))
+
+# Network available -> ((network text, state), (sync text, state))
+_NETWORK_STATES = {
+    True: (("Online", "ok"), ("Syncing", "ok")),
+    False: (("Offline", "off"), ("Offline Mode", "warn"))
+}
+
 class DashboardWidget(QWidget):
     # Signals
     logout_requested = pyqtSignal()
     
-    def __init__(self):
+    def __init__(self, data_manager=None):
         super().__init__()
         
-        # Initialize components
+        # Initialize components; the data manager is shared with the main window when given
         self.eye_tracker = EyeTracker()
         self.system_monitor = SystemMonitor()
-        self.data_manager = DataManager()
+        self.data_manager = data_manager or DataManager()
         
         # Monitoring state
         self.is_monitoring = False
         
+        # Last rendered indicator states; labels are only restyled on change
+        self._last_strain = len(_STRAIN_STATES) - 1
+        self._last_network = None
+        self._last_cpu = self._last_mem = self._last_pwr = -1
+        self._last_values = {}  # label -> raw value it currently shows
+        
+        # Panels that need repainting on the next tick
+        self._dirty = _DIRTY_ALL
+        
+        # Latest metrics pushed by the system monitor thread
+        self._system_data = None
+        
         # Timers
         self.update_timer = QTimer()
         self.save_timer = QTimer()
+        self.repaint_timer = QTimer()
+        self.repaint_timer.setSingleShot(True)
+        self.repaint_timer.setInterval(_REPAINT_COALESCE_MS)
         
         # Initialize UI
         self.init_ui()
@@ -56,13 +104,7 @@ class DashboardWidget(QWidget):
         """Create control bar with start/stop and logout buttons"""
         control_frame = QFrame()
         control_frame.setFixedHeight(60)
-        control_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2b2b2b;
-                border: 1px solid #404040;
-                border-radius: 5px;
-            }
-        """)
+        control_frame.setObjectName("barFrame")
         
         control_layout = QHBoxLayout(control_frame)
         control_layout.setContentsMargins(15, 10, 15, 10)
@@ -70,29 +112,22 @@ class DashboardWidget(QWidget):
         # Start/Stop monitoring button
         self.monitor_button = QPushButton("Start Monitoring")
         self.monitor_button.setFixedSize(150, 40)
-        self.monitor_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4caf50;
-                font-size: 13px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #5cbf60;
-            }
-        """)
+        self.monitor_button.setObjectName("monitorButton")
+        self.monitor_button.setProperty("active", False)
         control_layout.addWidget(self.monitor_button)
         
         # Spacer
         control_layout.addStretch()
         
         # Status indicator
-        self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet("color: #ff6b6b; font-size: 20px;")
+        self._dot_active = status_dot("#4caf50", 16)
+        self._dot_stopped = status_dot("#ff6b6b", 16)
+        self.status_indicator = QLabel()
+        self.status_indicator.setPixmap(self._dot_stopped)
         control_layout.addWidget(self.status_indicator)
         
         self.status_text = QLabel("Monitoring Stopped")
-        self.status_text.setStyleSheet("color: #cccccc; font-weight: bold;")
+        self.status_text.setObjectName("statusText")
         control_layout.addWidget(self.status_text)
         
         # Spacer
@@ -101,17 +136,7 @@ class DashboardWidget(QWidget):
         # Logout button
         logout_button = QPushButton("Logout")
         logout_button.setFixedSize(100, 40)
-        logout_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                font-size: 13px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #f55346;
-            }
-        """)
+        logout_button.setObjectName("logoutButton")
         logout_button.clicked.connect(self.logout_requested.emit)
         control_layout.addWidget(logout_button)
         
@@ -143,83 +168,48 @@ class DashboardWidget(QWidget):
         
         # Blink counter display
         blink_frame = QFrame()
-        blink_frame.setStyleSheet("""
-            QFrame {
-                background-color: #353535;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        blink_frame.setObjectName("blinkFrame")
         
         blink_layout = QVBoxLayout(blink_frame)
         
         # Current session blinks
         self.blink_count_label = QLabel("0")
         self.blink_count_label.setAlignment(Qt.AlignCenter)
-        self.blink_count_label.setStyleSheet("""
-            font-size: 48px;
-            font-weight: bold;
-            color: #2a82da;
-        """)
+        self.blink_count_label.setObjectName("blinkCount")
         blink_layout.addWidget(self.blink_count_label)
         
         blink_text = QLabel("Blinks This Session")
         blink_text.setAlignment(Qt.AlignCenter)
-        blink_text.setStyleSheet("color: #cccccc; font-size: 14px;")
+        blink_text.setObjectName("blinkCaption")
         blink_layout.addWidget(blink_text)
         
         layout.addWidget(blink_frame)
         
         # Statistics
         stats_frame = QFrame()
-        stats_frame.setStyleSheet("""
-            QFrame {
-                background-color: #353535;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
-        
-        stats_layout = QGridLayout(stats_frame)
-        
-        # Blinks per minute
-        stats_layout.addWidget(QLabel("Blinks/Min:"), 0, 0)
-        self.bpm_label = QLabel("0")
-        self.bpm_label.setStyleSheet("color: #2a82da; font-weight: bold;")
-        stats_layout.addWidget(self.bpm_label, 0, 1)
-        
-        # Session duration
-        stats_layout.addWidget(QLabel("Session Time:"), 1, 0)
-        self.session_time_label = QLabel("00:00:00")
-        self.session_time_label.setStyleSheet("color: #2a82da; font-weight: bold;")
-        stats_layout.addWidget(self.session_time_label, 1, 1)
-        
-        # Eye strain indicator
-        stats_layout.addWidget(QLabel("Eye Strain:"), 2, 0)
-        self.eye_strain_label = QLabel("Normal")
-        self.eye_strain_label.setStyleSheet("color: #4caf50; font-weight: bold;")
-        stats_layout.addWidget(self.eye_strain_label, 2, 1)
+        stats_frame.setObjectName("panelFrame")
+        
+        stats_layout = QVBoxLayout(stats_frame)
+        
+        # Blinks per minute, session duration and eye strain, painted as one widget
+        self.eye_stats = StatsPanel(_EYE_STAT_TITLES)
+        self.eye_stats.set_value(_STAT_BPM, "0.0")
+        self.eye_stats.set_value(_STAT_SESSION, "00:00:00")
+        text, color = _STRAIN_STATES[self._last_strain]
+        self.eye_stats.set_value(_STAT_STRAIN, text, color)
+        stats_layout.addWidget(self.eye_stats)
         
         layout.addWidget(stats_frame)
         
         # Camera status
         camera_frame = QFrame()
-        camera_frame.setStyleSheet("""
-            QFrame {
-                background-color: #353535;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        camera_frame.setObjectName("panelFrame")
         
         camera_layout = QHBoxLayout(camera_frame)
         
         camera_layout.addWidget(QLabel("Camera Status:"))
         self.camera_status_label = QLabel("Disconnected")
-        self.camera_status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+        self.camera_status_label.setProperty("state", "off")
         camera_layout.addWidget(self.camera_status_label)
         camera_layout.addStretch()
         
@@ -247,20 +237,13 @@ class DashboardWidget(QWidget):
         
         # Network Status
         network_frame = QFrame()
-        network_frame.setStyleSheet("""
-            QFrame {
-                background-color: #353535;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        network_frame.setObjectName("panelFrame")
         
         network_layout = QHBoxLayout(network_frame)
         
         network_layout.addWidget(QLabel("Network Status:"))
         self.network_status_label = QLabel("Checking...")
-        self.network_status_label.setStyleSheet("color: #ffeb3b; font-weight: bold;")
+        self.network_status_label.setProperty("state", "warn")
         network_layout.addWidget(self.network_status_label)
         network_layout.addStretch()
         
@@ -271,20 +254,13 @@ class DashboardWidget(QWidget):
     def create_metric_frame(self, title, metric_type):
         """Create a frame for displaying a system metric"""
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: #353535;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        frame.setObjectName("panelFrame")
         
         layout = QVBoxLayout(frame)
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: #cccccc; font-weight: bold; font-size: 12px;")
+        title_label.setObjectName("metricTitle")
         layout.addWidget(title_label)
         
         # Progress bar
@@ -305,7 +281,7 @@ class DashboardWidget(QWidget):
         
         # Value label
         value_label = QLabel("0%")
-        value_label.setStyleSheet("color: #2a82da; font-weight: bold;")
+        value_label.setObjectName("metricValue")
         
         if metric_type == "cpu":
             self.cpu_value_label = value_label
@@ -322,13 +298,7 @@ class DashboardWidget(QWidget):
         """Create bottom status area"""
         status_frame = QFrame()
         status_frame.setFixedHeight(100)
-        status_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2b2b2b;
-                border: 1px solid #404040;
-                border-radius: 5px;
-            }
-        """)
+        status_frame.setObjectName("barFrame")
         
         status_layout = QVBoxLayout(status_frame)
         status_layout.setContentsMargins(15, 10, 15, 10)
@@ -338,7 +308,7 @@ class DashboardWidget(QWidget):
         
         sync_layout.addWidget(QLabel("Data Sync:"))
         self.sync_status_label = QLabel("Offline Mode")
-        self.sync_status_label.setStyleSheet("color: #ffeb3b; font-weight: bold;")
+        self.sync_status_label.setProperty("state", "warn")
         sync_layout.addWidget(self.sync_status_label)
         
         sync_layout.addStretch()
@@ -346,14 +316,14 @@ class DashboardWidget(QWidget):
         # Last sync time
         sync_layout.addWidget(QLabel("Last Sync:"))
         self.last_sync_label = QLabel("Never")
-        self.last_sync_label.setStyleSheet("color: #cccccc;")
+        self.last_sync_label.setObjectName("lastSync")
         sync_layout.addWidget(self.last_sync_label)
         
         status_layout.addLayout(sync_layout)
         
         # GDPR compliance notice
         gdpr_label = QLabel("🔒 All data is processed according to GDPR compliance standards. Data is encrypted and can be deleted upon request.")
-        gdpr_label.setStyleSheet("color: #808080; font-size: 10px; font-style: italic;")
+        gdpr_label.setObjectName("gdprNotice")
         gdpr_label.setWordWrap(True)
         status_layout.addWidget(gdpr_label)
         
@@ -364,8 +334,20 @@ class DashboardWidget(QWidget):
         # Monitor button
         self.monitor_button.clicked.connect(self.toggle_monitoring)
         
-        # Update timer - updates UI every second
+        # Update timer - repaints changed panels every second
         self.update_timer.timeout.connect(self.update_display)
+        self.repaint_timer.timeout.connect(self.update_display)
+        
+        # Tracker change notifications mark panels dirty; both are emitted from
+        # acquisition threads, so force delivery on the GUI thread
+        self.eye_tracker.blink_detected.connect(self._mark_blinks_dirty, Qt.QueuedConnection)
+        self.system_monitor.metrics_updated.connect(self._on_system_metrics, Qt.QueuedConnection)
+        
+        # Record each blink; queueing is locked, so stay on the tracker thread and keep its timestamp
+        self.eye_tracker.blink_detected.connect(self.data_manager.save_blink_event, Qt.DirectConnection)
+        
+        # Writes land on a thread pool worker; show when they reach disk
+        self.data_manager.data_flushed.connect(self._on_data_flushed, Qt.QueuedConnection)
         
         # Save timer - saves data every 30 seconds
         self.save_timer.timeout.connect(self.save_data)
@@ -384,35 +366,27 @@ class DashboardWidget(QWidget):
             # Start system monitor
             self.system_monitor.start()
             
-            # Start timers
-            self.update_timer.start(1000)  # Update every second
+            # Start timers, repainting everything on the first tick
+            self._dirty = _DIRTY_ALL
+            self.update_timer.start(1000)  # Session clock tick; changes repaint on their own
             self.save_timer.start(30000)   # Save every 30 seconds
             
-            # Update UI
+            # Update UI in one paint
             self.is_monitoring = True
-            self.monitor_button.setText("Stop Monitoring")
-            self.monitor_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    font-size: 13px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #f55346;
-                }
-            """)
-            
-            self.status_indicator.setStyleSheet("color: #4caf50; font-size: 20px;")
-            self.status_text.setText("Monitoring Active")
-            
-            # Update camera status
-            if self.eye_tracker.is_camera_available():
-                self.camera_status_label.setText("Connected")
-                self.camera_status_label.setStyleSheet("color: #4caf50; font-weight: bold;")
-            else:
-                self.camera_status_label.setText("Simulated")
-                self.camera_status_label.setStyleSheet("color: #ffeb3b; font-weight: bold;")
+            with self._updates_suspended():
+                self.monitor_button.setText("Stop Monitoring")
+                self._set_state(self.monitor_button, True, "active")
+                
+                self.status_indicator.setPixmap(self._dot_active)
+                self.status_text.setText("Monitoring Active")
+                
+                # Update camera status
+                if self.eye_tracker.is_camera_available():
+                    self.camera_status_label.setText("Connected")
+                    self._set_state(self.camera_status_label, "ok")
+                else:
+                    self.camera_status_label.setText("Simulated")
+                    self._set_state(self.camera_status_label, "warn")
             
             logger.info("Monitoring started successfully")
             
@@ -431,6 +405,7 @@ class DashboardWidget(QWidget):
             # Stop timers
             self.update_timer.stop()
             self.save_timer.stop()
+            self.repaint_timer.stop()
             
             # Stop components
             self.eye_tracker.stop()
@@ -439,25 +414,16 @@ class DashboardWidget(QWidget):
             # Save final data
             self.save_data()
             
-            # Update UI
+            # Update UI in one paint
             self.is_monitoring = False
-            self.monitor_button.setText("Start Monitoring")
-            self.monitor_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4caf50;
-                    font-size: 13px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #5cbf60;
-                }
-            """)
-            
-            self.status_indicator.setStyleSheet("color: #ff6b6b; font-size: 20px;")
-            self.status_text.setText("Monitoring Stopped")
-            self.camera_status_label.setText("Disconnected")
-            self.camera_status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+            with self._updates_suspended():
+                self.monitor_button.setText("Start Monitoring")
+                self._set_state(self.monitor_button, False, "active")
+                
+                self.status_indicator.setPixmap(self._dot_stopped)
+                self.status_text.setText("Monitoring Stopped")
+                self.camera_status_label.setText("Disconnected")
+                self._set_state(self.camera_status_label, "off")
             
             logger.info("Monitoring stopped successfully")
             
@@ -471,59 +437,104 @@ class DashboardWidget(QWidget):
         else:
             self.start_monitoring()
     
+    @contextmanager
+    def _updates_suspended(self):
+        """Defer repaints of this widget and its children until the block exits"""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            # Re-enabling schedules a single update() for the whole widget
+            self.setUpdatesEnabled(True)
+    
+    def _set_state(self, widget, state, name="state"):
+        """Restyle a widget by re-polishing it with a new value for a dynamic property"""
+        widget.setProperty(name, state)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+    
+    def _set_label_value(self, label, value, fmt):
+        """Format and set a label's text only when its raw value changed; returns whether it did"""
+        if self._last_values.get(label) == value:
+            return False
+        self._last_values[label] = value
+        label.setText(fmt.format(value))
+        return True
+    
+    def _request_repaint(self):
+        """Repaint shortly, folding any further events in the window into the same pass"""
+        if not self.repaint_timer.isActive():
+            self.repaint_timer.start()
+    
+    def _mark_blinks_dirty(self):
+        """Flag the blink counter for repaint"""
+        self._dirty |= _DIRTY_BLINKS
+        self._request_repaint()
+    
+    def _on_system_metrics(self, metrics):
+        """Keep the pushed metrics snapshot and flag the system panel for repaint"""
+        self._system_data = metrics
+        self._dirty |= _DIRTY_SYSTEM
+        self._request_repaint()
+    
     def update_display(self):
-        """Update all display elements"""
+        """Update display elements that changed since the last tick"""
+        dirty, self._dirty = self._dirty, 0
+        
         try:
-            # Update eye tracking data
+            # Update eye tracking data; duration and rate move with time, so refresh them every tick
             if self.eye_tracker.is_running:
                 blink_data = self.eye_tracker.get_current_data()
                 
-                self.blink_count_label.setText(str(blink_data['total_blinks']))
-                self.bpm_label.setText(f"{blink_data['blinks_per_minute']:.1f}")
-                self.session_time_label.setText(blink_data['session_duration'])
+                if dirty & _DIRTY_BLINKS:
+                    self._set_label_value(self.blink_count_label, blink_data.total_blinks, "{}")
+                self.eye_stats.set_value(_STAT_BPM, f"{blink_data.blinks_per_minute:.1f}")
+                self.eye_stats.set_value(_STAT_SESSION, blink_data.session_duration)
                 
                 # Update eye strain indicator
-                bpm = blink_data['blinks_per_minute']
-                if bpm < 10:
-                    self.eye_strain_label.setText("High Strain")
-                    self.eye_strain_label.setStyleSheet("color: #f44336; font-weight: bold;")
-                elif bpm < 15:
-                    self.eye_strain_label.setText("Moderate")
-                    self.eye_strain_label.setStyleSheet("color: #ffeb3b; font-weight: bold;")
-                else:
-                    self.eye_strain_label.setText("Normal")
-                    self.eye_strain_label.setStyleSheet("color: #4caf50; font-weight: bold;")
+                strain = bisect_right(_STRAIN_THRESHOLDS, blink_data.blinks_per_minute)
+                if strain != self._last_strain:
+                    self._last_strain = strain
+                    text, color = _STRAIN_STATES[strain]
+                    self.eye_stats.set_value(_STAT_STRAIN, text, color)
             
             # Update system monitoring data
-            if self.system_monitor.is_running:
-                system_data = self.system_monitor.get_current_data()
-                
-                # CPU usage
-                cpu_percent = system_data['cpu_percent']
-                self.cpu_progress.setValue(int(cpu_percent))
-                self.cpu_value_label.setText(f"{cpu_percent:.1f}%")
+            system_data = self._system_data
+            if self.system_monitor.is_running and system_data is not None and dirty & _DIRTY_SYSTEM:
+                # CPU usage (bars only move when the whole percent changes)
+                cpu_percent = system_data.cpu_percent
+                value = int(cpu_percent)
+                if value != self._last_cpu:
+                    self._last_cpu = value
+                    self.cpu_progress.setValue(value)
+                cpu_changed = self._set_label_value(self.cpu_value_label, round(cpu_percent, 1), "{:.1f}%")
                 
                 # Memory usage
-                memory_percent = system_data['memory_percent']
-                self.memory_progress.setValue(int(memory_percent))
-                self.memory_value_label.setText(f"{memory_percent:.1f}%")
+                memory_percent = system_data.memory_percent
+                value = int(memory_percent)
+                if value != self._last_mem:
+                    self._last_mem = value
+                    self.memory_progress.setValue(value)
+                self._set_label_value(self.memory_value_label, round(memory_percent, 1), "{:.1f}%")
                 
-                # Power impact (simulated based on CPU usage)
-                power_impact = min(100, cpu_percent * 1.2)
-                self.power_progress.setValue(int(power_impact))
-                self.power_value_label.setText(f"{power_impact:.1f}%")
+                # Power impact (simulated from CPU usage, so it only moves with the CPU reading)
+                if cpu_changed:
+                    power_impact = min(100, cpu_percent * 1.2)
+                    value = int(power_impact)
+                    if value != self._last_pwr:
+                        self._last_pwr = value
+                        self.power_progress.setValue(value)
+                    self._set_label_value(self.power_value_label, round(power_impact, 1), "{:.1f}%")
                 
                 # Network status
-                if system_data['network_available']:
-                    self.network_status_label.setText("Online")
-                    self.network_status_label.setStyleSheet("color: #4caf50; font-weight: bold;")
-                    self.sync_status_label.setText("Syncing")
-                    self.sync_status_label.setStyleSheet("color: #4caf50; font-weight: bold;")
-                else:
-                    self.network_status_label.setText("Offline")
-                    self.network_status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
-                    self.sync_status_label.setText("Offline Mode")
-                    self.sync_status_label.setStyleSheet("color: #ffeb3b; font-weight: bold;")
+                network = bool(system_data.network_available)
+                if network != self._last_network:
+                    self._last_network = network
+                    (network_text, network_state), (sync_text, sync_state) = _NETWORK_STATES[network]
+                    self.network_status_label.setText(network_text)
+                    self._set_state(self.network_status_label, network_state)
+                    self.sync_status_label.setText(sync_text)
+                    self._set_state(self.sync_status_label, sync_state)
             
         except Exception as e:
             logger.error(f"Error updating display: {e}")
@@ -536,18 +547,18 @@ class DashboardWidget(QWidget):
                 eye_data = self.eye_tracker.get_current_data()
                 system_data = self.system_monitor.get_current_data()
                 
-                # Save to data manager
+                # Queue for the data manager's background writer
                 self.data_manager.save_session_data(eye_data, system_data)
                 
-                # Update last sync time
-                from datetime import datetime
-                self.last_sync_label.setText(datetime.now().strftime("%H:%M:%S"))
-                
                 logger.debug("Session data saved")
                 
         except Exception as e:
             logger.error(f"Error saving data: {e}")
     
+    def _on_data_flushed(self, row_count):
+        """Update last sync time once buffered data is written to disk"""
+        self.last_sync_label.setText(time.strftime("%H:%M:%S"))
+    
     def show_error(self, message):
         """Show error message to user"""
         # For now, just log the error
@@ -1,14 +1,14 @@
 import logging
+import time
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QStackedWidget, QLabel, QFrame, QSplitter)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QPixmap
 
 from .auth_widget import AuthWidget
-from .dashboard_widget import DashboardWidget
 from .status_bar import CustomStatusBar
-from core.auth_manager import AuthManager
-from core.data_manager import DataManager
+from ..core.auth_manager import AuthManager
+from ..core.data_manager import DataManager
 
 logger = logging.getLogger(__name__)
 
@@ -55,13 +55,13 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         main_layout.addWidget(self.stacked_widget)
         
-        # Create screens
+        # Create screens (the dashboard is built on first login)
         self.auth_widget = AuthWidget()
-        self.dashboard_widget = DashboardWidget()
+        self.dashboard_widget = None
+        self.record_count = 0
         
         # Add screens to stack
         self.stacked_widget.addWidget(self.auth_widget)
-        self.stacked_widget.addWidget(self.dashboard_widget)
         
         # Status bar
         self.status_bar = CustomStatusBar()
@@ -72,30 +72,16 @@ class MainWindow(QMainWindow):
         header_frame = QFrame()
         header_frame.setFixedHeight(60)
         header_frame.setObjectName("headerFrame")
-        header_frame.setStyleSheet("""
-            QFrame#headerFrame {
-                background-color: #2b2b2b;
-                border-bottom: 2px solid #404040;
-            }
-        """)
         
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(20, 10, 20, 10)
         
         # App title
         title_label = QLabel("Wellness at Work")
-        title_label.setStyleSheet("""
-            color: white;
-            font-size: 18px;
-            font-weight: bold;
-        """)
+        title_label.setObjectName("headerTitle")
         
         subtitle_label = QLabel("Eye Tracker & Performance Monitor")
-        subtitle_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-            margin-left: 10px;
-        """)
+        subtitle_label.setObjectName("headerSubtitle")
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(subtitle_label)
@@ -103,10 +89,7 @@ class MainWindow(QMainWindow):
         
         # User info (hidden initially)
         self.user_info_label = QLabel("")
-        self.user_info_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-        """)
+        self.user_info_label.setObjectName("userInfo")
         self.user_info_label.hide()
         header_layout.addWidget(self.user_info_label)
         
@@ -117,11 +100,12 @@ class MainWindow(QMainWindow):
         # Auth widget connections
         self.auth_widget.login_successful.connect(self.on_login_successful)
         
-        # Dashboard widget connections
-        self.dashboard_widget.logout_requested.connect(self.on_logout_requested)
-        
         # Auth manager connections
         self.auth_manager.authentication_changed.connect(self.on_auth_changed)
+        
+        # Status bar is driven by data manager events rather than polling
+        self.data_manager.data_flushed.connect(self.on_data_flushed)
+        self.data_manager.sync_completed.connect(self.on_sync_completed)
     
     def show_auth_screen(self):
         """Show authentication screen"""
@@ -132,6 +116,20 @@ class MainWindow(QMainWindow):
     
     def show_dashboard(self):
         """Show main dashboard"""
+        if self.dashboard_widget is None:
+            # Deferred until first login: loads OpenCV and builds the tracker managers
+            from .dashboard_widget import DashboardWidget
+            
+            # Share the data manager so its flushes and syncs reach the status bar
+            self.dashboard_widget = DashboardWidget(self.data_manager)
+            self.dashboard_widget.logout_requested.connect(self.on_logout_requested)
+            self.stacked_widget.addWidget(self.dashboard_widget)
+            
+            # Seed the record count once; flushes keep it current from here
+            stats = self.data_manager.get_database_stats()
+            self.record_count = stats['total_metrics'] + stats['total_blinks'] if stats else 0
+            self.status_bar.update_data_count(self.record_count)
+        
         self.stacked_widget.setCurrentWidget(self.dashboard_widget)
         self.dashboard_widget.start_monitoring()
         logger.info("Showing dashboard")
@@ -158,7 +156,7 @@ class MainWindow(QMainWindow):
         logger.info("Logout requested")
         
         # Stop monitoring
-        self.dashboard_widget.stop_monitoring()
+        self._stop_dashboard()
         
         # Clear authentication
         self.auth_manager.logout()
@@ -169,6 +167,21 @@ class MainWindow(QMainWindow):
         # Emit signal
         self.user_logged_out.emit()
     
+    def _stop_dashboard(self):
+        """Stop dashboard monitoring if the dashboard has been built"""
+        if self.dashboard_widget is not None:
+            self.dashboard_widget.stop_monitoring()
+    
+    def on_data_flushed(self, row_count):
+        """Update the status bar record count after rows reach the database"""
+        self.record_count += row_count
+        self.status_bar.update_data_count(self.record_count)
+    
+    def on_sync_completed(self, success):
+        """Update the status bar after a sync pass"""
+        if success:
+            self.status_bar.update_sync_status(time.strftime("%H:%M:%S"))
+    
     def on_auth_changed(self, is_authenticated, username):
         """Handle authentication state change"""
         if is_authenticated:
@@ -181,8 +194,7 @@ class MainWindow(QMainWindow):
         logger.info("Application closing")
         
         # Stop monitoring
-        if hasattr(self, 'dashboard_widget'):
-            self.dashboard_widget.stop_monitoring()
+        self._stop_dashboard()
         
         # Save any pending data
         if hasattr(self, 'data_manager'):
@@ -0,0 +1,106 @@
+"""
+Painted title/value readout for fixed-shape statistics
+"""
+import logging
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import QEvent, QPointF, QRect, QSize
+from PyQt5.QtGui import QColor, QFont, QPainter, QStaticText
+
+from .theme import THEME
+
+logger = logging.getLogger(__name__)
+
+# Layout spacing in pixels
+_ROW_SPACING = 8
+_COLUMN_SPACING = 12
+
+# Room reserved for the value column when sizing the panel
+_VALUE_MIN_WIDTH = 100
+
+class StatsPanel(QWidget):
+    """Grid of title/value rows painted in one pass from cached static text"""
+    
+    def __init__(self, titles, parent=None):
+        super().__init__(parent)
+        
+        self._titles = [QStaticText(title) for title in titles]
+        self._values = [QStaticText("") for _ in titles]
+        self._colors = [QColor(THEME.accent) for _ in titles]
+        self._title_color = QColor(THEME.text)
+        self._geometry = None  # (row height, value column x), reset on font change
+        
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+    
+    def set_value(self, row, text, color=None):
+        """Set a row's value text and optional color, repainting only that cell"""
+        static = self._values[row]
+        changed = static.text() != text
+        if changed:
+            static.setText(text)
+        if color is not None and self._colors[row].name() != color:
+            self._colors[row] = QColor(color)
+            changed = True
+            
+        if changed:
+            self.update(self._value_rect(row))
+    
+    def _value_font(self):
+        """Get the bold font used for values"""
+        font = QFont(self.font())
+        font.setBold(True)
+        return font
+    
+    def _layout(self):
+        """Get (row height, value column x), measured once per font"""
+        if self._geometry is None:
+            metrics = self.fontMetrics()
+            row_height = metrics.height() + _ROW_SPACING
+            title_width = max((metrics.horizontalAdvance(title.text()) for title in self._titles), default=0)
+            self._geometry = (row_height, title_width + _COLUMN_SPACING)
+        return self._geometry
+    
+    def _value_rect(self, row):
+        """Get the cell rectangle holding a row's value"""
+        row_height, value_x = self._layout()
+        return QRect(value_x, row * row_height, self.width() - value_x, row_height)
+    
+    def changeEvent(self, event):
+        """Drop cached text layout when the font changes"""
+        if event.type() == QEvent.FontChange:
+            self._geometry = None
+            self.updateGeometry()
+        super().changeEvent(event)
+    
+    def sizeHint(self):
+        """Size the panel to fit every row"""
+        row_height, value_x = self._layout()
+        return QSize(value_x + _VALUE_MIN_WIDTH, row_height * len(self._titles))
+    
+    def minimumSizeHint(self):
+        """Never shrink below the space the rows need"""
+        return self.sizeHint()
+    
+    def paintEvent(self, event):
+        """Draw the rows intersecting the exposed region"""
+        row_height, value_x = self._layout()
+        exposed = event.rect()
+        offset = _ROW_SPACING / 2
+        
+        painter = QPainter(self)
+        value_font = self._value_font()
+        
+        for row, (title, value) in enumerate(zip(self._titles, self._values)):
+            y = row * row_height
+            if y > exposed.bottom() or y + row_height < exposed.top():
+                continue
+                
+            if exposed.left() < value_x:
+                painter.setFont(self.font())
+                painter.setPen(self._title_color)
+                painter.drawStaticText(QPointF(0, y + offset), title)
+                
+            painter.setFont(value_font)
+            painter.setPen(self._colors[row])
+            painter.drawStaticText(QPointF(value_x, y + offset), value)
+            
+        painter.end()
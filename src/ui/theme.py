@@ -1,7 +1,149 @@
-from PyQt5.QtGui import QPalette, QColor
+from dataclasses import dataclass
+from PyQt5.QtGui import QPalette, QColor, QPixmap, QPixmapCache, QPainter
 from PyQt5.QtCore import Qt
 
-def apply_dark_theme(app):
+@dataclass(frozen=True)
+class Theme:
+    """Theme colors, read as attributes (THEME.accent) by UI code"""
+    accent: str = "#2a82da"
+    background: str = "#353535"
+    secondary_background: str = "#2b2b2b"
+    text: str = "#ffffff"
+    secondary_text: str = "#cccccc"
+
+THEME = Theme()
+
+# Component rules, keyed off object names and dynamic properties so every
+# widget shares the application's single style tree
+_COMPONENT_QSS = """
+    /* Header */
+    QFrame#headerFrame {
+        background-color: #2b2b2b;
+        border-bottom: 2px solid #404040;
+    }
+    QLabel#headerTitle {
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QLabel#headerSubtitle {
+        color: #cccccc;
+        font-size: 12px;
+        margin-left: 10px;
+    }
+    QLabel#userInfo {
+        color: #cccccc;
+        font-size: 12px;
+    }
+    
+    /* Status bar */
+    QLabel#connectionLabel { font-weight: bold; }
+    QLabel#syncLabel, QLabel#dataCountLabel { color: #cccccc; }
+    QLabel#syncLabel[synced="true"] { color: #4caf50; }
+    QLabel#gdprLabel { color: #4caf50; font-weight: bold; }
+    
+    /* Login form */
+    QFrame#loginContainer {
+        background-color: #2b2b2b;
+        border: 1px solid #404040;
+        border-radius: 10px;
+    }
+    QLabel#titleLabel {
+        color: white;
+        font-size: 24px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    QLabel#subtitleLabel {
+        color: #cccccc;
+        font-size: 12px;
+        margin-bottom: 20px;
+    }
+    QLabel#fieldLabel {
+        color: #cccccc;
+        font-weight: bold;
+    }
+    QPushButton#loginButton {
+        background-color: #2a82da;
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#loginButton:hover {
+        background-color: #3a92ea;
+    }
+    QPushButton#loginButton:pressed {
+        background-color: #1a72ca;
+    }
+    QLabel#statusLabel {
+        color: #ff6b6b;
+        font-size: 11px;
+    }
+    QLabel#statusLabel[error="false"] {
+        color: #4caf50;
+    }
+    QLabel#demoInfo {
+        color: #808080;
+        font-size: 10px;
+        font-style: italic;
+        margin-top: 10px;
+    }
+    
+    /* Dashboard controls */
+    QPushButton#monitorButton, QPushButton#logoutButton {
+        font-size: 13px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#monitorButton {
+        background-color: #4caf50;
+    }
+    QPushButton#monitorButton:hover {
+        background-color: #5cbf60;
+    }
+    QPushButton#monitorButton[active="true"], QPushButton#logoutButton {
+        background-color: #f44336;
+    }
+    QPushButton#monitorButton[active="true"]:hover, QPushButton#logoutButton:hover {
+        background-color: #f55346;
+    }
+    
+    /* Dashboard panels; the panel rules also cover nested QFrames (including labels) */
+    QFrame#barFrame, QFrame#barFrame QFrame {
+        background-color: #2b2b2b;
+        border: 1px solid #404040;
+        border-radius: 5px;
+    }
+    QFrame#blinkFrame, QFrame#blinkFrame QFrame {
+        background-color: #353535;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 15px;
+    }
+    QFrame#panelFrame, QFrame#panelFrame QFrame {
+        background-color: #353535;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QLabel#statusText { color: #cccccc; font-weight: bold; }
+    QLabel#blinkCount { font-size: 48px; font-weight: bold; color: #2a82da; }
+    QLabel#blinkCaption { color: #cccccc; font-size: 14px; }
+    QLabel#metricTitle { color: #cccccc; font-weight: bold; font-size: 12px; }
+    QLabel#metricValue { color: #2a82da; font-weight: bold; }
+    QLabel#lastSync { color: #cccccc; }
+    QLabel#gdprNotice { color: #808080; font-size: 10px; font-style: italic; }
+    
+    QLabel[state="ok"] { color: #4caf50; font-weight: bold; }
+    QLabel[state="warn"] { color: #ffeb3b; font-weight: bold; }
+    QLabel[state="off"] { color: #ff6b6b; font-weight: bold; }
+    QLabel[state="high"] { color: #f44336; font-weight: bold; }
+"""
+
+def _build_palette():
+    """Build the dark palette"""
     # Create dark palette
     dark_palette = QPalette()
     
@@ -34,194 +176,145 @@ def apply_dark_theme(app):
     dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
     dark_palette.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
     
-    # Apply palette
-    app.setPalette(dark_palette)
-    
-    # Additional stylesheet for specific widgets
-    app.setStyleSheet("""
-        QMainWindow {
-            background-color: #353535;
-        }
-        
-        QWidget {
-            background-color: #353535;
-            color: white;
-        }
-        
-        QLineEdit {
-            background-color: #2b2b2b;
-            border: 1px solid #404040;
-            border-radius: 5px;
-            padding: 8px;
-            color: white;
-            font-size: 12px;
-        }
-        
-        QLineEdit:focus {
-            border: 2px solid #2a82da;
-        }
-        
-        QPushButton {
-            background-color: #2a82da;
-            border: none;
-            border-radius: 5px;
-            color: white;
-            font-size: 12px;
-            font-weight: bold;
-            padding: 10px 20px;
-            min-width: 80px;
-        }
-        
-        QPushButton:hover {
-            background-color: #3a92ea;
-        }
-        
-        QPushButton:pressed {
-            background-color: #1a72ca;
-        }
-        
-        QPushButton:disabled {
-            background-color: #404040;
-            color: #808080;
-        }
-        
-        QLabel {
-            color: white;
-        }
-        
-        QFrame {
-            background-color: #353535;
-        }
-        
-        QGroupBox {
-            background-color: #2b2b2b;
-            border: 1px solid #404040;
-            border-radius: 5px;
-            margin: 5px;
-            padding-top: 15px;
-            font-weight: bold;
-        }
-        
-        QGroupBox::title {
-            color: #cccccc;
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-        
-        QProgressBar {
-            background-color: #2b2b2b;
-            border: 1px solid #404040;
-            border-radius: 5px;
-            text-align: center;
-            color: white;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #2a82da;
-            border-radius: 3px;
-        }
-        
-        QStatusBar {
-            background-color: #2b2b2b;
-            border-top: 1px solid #404040;
-            color: #cccccc;
-        }
-        
-        QMenuBar {
-            background-color: #2b2b2b;
-            color: white;
-            border-bottom: 1px solid #404040;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 4px 8px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #2a82da;
-        }
-        
-        QMenu {
-            background-color: #2b2b2b;
-            border: 1px solid #404040;
-            color: white;
-        }
-        
-        QMenu::item {
-            padding: 5px 20px;
-        }
-        
-        QMenu::item:selected {
-            background-color: #2a82da;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #404040;
-            background-color: #353535;
-        }
-        
-        QTabBar::tab {
-            background-color: #2b2b2b;
-            border: 1px solid #404040;
-            padding: 8px 16px;
-            margin-right: 2px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #2a82da;
-            color: white;
-        }
-        
-        QScrollBar:vertical {
-            background-color: #2b2b2b;
-            width: 12px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #404040;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #505050;
-        }
-        
-        QTableWidget {
-            background-color: #2b2b2b;
-            border: 1px solid #404040;
-            gridline-color: #404040;
-            selection-background-color: #2a82da;
-        }
-        
-        QHeaderView::section {
-            background-color: #404040;
-            color: white;
-            padding: 5px;
-            border: none;
-            font-weight: bold;
-        }
-    """)
+    return dark_palette
+
+# Application stylesheet: base widget rules followed by the component rules.
+# Only widget types the app instantiates get rules; every extra selector is
+# matched against every widget when it is polished.
+_DARK_QSS = """
+    QMainWindow {
+        background-color: #353535;
+    }
+    
+    QWidget {
+        background-color: #353535;
+        color: white;
+    }
+    
+    QLineEdit {
+        background-color: #2b2b2b;
+        border: 1px solid #404040;
+        border-radius: 5px;
+        padding: 8px;
+        color: white;
+        font-size: 12px;
+    }
+    
+    QLineEdit:focus {
+        border: 2px solid #2a82da;
+    }
+    
+    QPushButton {
+        background-color: #2a82da;
+        border: none;
+        border-radius: 5px;
+        color: white;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 10px 20px;
+        min-width: 80px;
+    }
+    
+    QPushButton:hover {
+        background-color: #3a92ea;
+    }
+    
+    QPushButton:pressed {
+        background-color: #1a72ca;
+    }
+    
+    QPushButton:disabled {
+        background-color: #404040;
+        color: #808080;
+    }
+    
+    QLabel {
+        color: white;
+    }
+    
+    QFrame {
+        background-color: #353535;
+    }
+    
+    QGroupBox {
+        background-color: #2b2b2b;
+        border: 1px solid #404040;
+        border-radius: 5px;
+        margin: 5px;
+        padding-top: 15px;
+        font-weight: bold;
+    }
+    
+    QGroupBox::title {
+        color: #cccccc;
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    
+    QProgressBar {
+        background-color: #2b2b2b;
+        border: 1px solid #404040;
+        border-radius: 5px;
+        text-align: center;
+        color: white;
+    }
+    
+    QProgressBar::chunk {
+        background-color: #2a82da;
+        border-radius: 3px;
+    }
+    
+    QStatusBar {
+        background-color: #2b2b2b;
+        border-top: 1px solid #404040;
+        color: #cccccc;
+    }
+""" + _COMPONENT_QSS
+
+# Built once at import; applying the theme only hands these to the application
+_DARK_PALETTE = _build_palette()
+
+def apply_dark_theme(app):
+    """Apply the dark palette and stylesheet to the application"""
+    app.setPalette(_DARK_PALETTE)
+    app.setStyleSheet(_DARK_QSS)
 
 def get_accent_color():
     """Get the accent color used in the theme"""
-    return "#2a82da"
+    return THEME.accent
 
 def get_background_color():
     """Get the main background color"""
-    return "#353535"
+    return THEME.background
 
 def get_secondary_background():
     """Get the secondary background color"""
-    return "#2b2b2b"
+    return THEME.secondary_background
 
 def get_text_color():
     """Get the main text color"""
-    return "#ffffff"
+    return THEME.text
 
 def get_secondary_text_color():
     """Get the secondary text color"""
-    return "#cccccc"
+    return THEME.secondary_text
+
+def status_dot(color, size=12):
+    """Get a cached round status glyph, rasterized once per color and size"""
+    key = f"status_dot:{color}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(0, 0, size - 1, size - 1)
+    painter.end()
+    
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
@@ -1,17 +1,23 @@
 """
 Utils Package - Contains utility modules and helper functions
 """
+import importlib
 
-# Import utility modules
-from .logger import setup_logger, get_logger
-from .config import Config, get_config
-from .gdpr import GDPRManager, get_gdpr_manager
+# Utility functions and classes, imported on first access so that loading one
+# utility (e.g. the logger at startup) does not pull in GDPR and cryptography
+_EXPORTS = {
+    'setup_logger': '.logger',
+    'get_logger': '.logger',
+    'Config': '.config',
+    'get_config': '.config',
+    'GDPRManager': '.gdpr',
+    'get_gdpr_manager': '.gdpr'
+}
 
-__all__ = [
-    'setup_logger',
-    'get_logger',
-    'Config',
-    'get_config',
-    'GDPRManager',
-    'get_gdpr_manager'
-]
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """Import an exported utility on first access"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -1,13 +1,70 @@
 """
 Configuration Management for the Wellness at Work Application
 """
-import json
+import atexit
+import copy
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 import logging
 
+from .json_codec import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Quiet period after the last set() before the config file is rewritten
+SAVE_DELAY_SECONDS = 0.5
+
+# Default configuration, built once; working configs are deep copies of it
+_DEFAULT_CONFIG = {
+    "app": {
+        "name": "Wellness at Work - Eye Tracker",
+        "version": "1.0.0",
+        "debug_mode": False,
+        "auto_start_monitoring": False
+    },
+    "eye_tracking": {
+        "simulation_mode": False,
+        "blink_threshold_frames": 5,
+        "camera_index": 0,
+        "camera_width": 640,
+        "camera_height": 480,
+        "camera_fps": 30
+    },
+    "system_monitoring": {
+        "update_interval_seconds": 2,
+        "metrics_history_minutes": 60,
+        "enable_battery_monitoring": True,
+        "enable_network_monitoring": True
+    },
+    "data": {
+        "auto_sync_enabled": True,
+        "sync_interval_minutes": 5,
+        "retention_days": 30,
+        "database_path": "data/wellness_tracker.db"
+    },
+    "ui": {
+        "theme": "dark",
+        "window_width": 1200,
+        "window_height": 800,
+        "remember_window_position": True,
+        "show_notifications": True
+    },
+    "privacy": {
+        "gdpr_compliance": True,
+        "data_encryption": True,
+        "anonymize_data": False,
+        "consent_required": True
+    },
+    "api": {
+        "base_url": "https://api.wellness-tracker.com",
+        "timeout_seconds": 30,
+        "retry_attempts": 3,
+        "use_ssl": True
+    }
+}
+
 class Config:
     """Application configuration manager"""
     
@@ -15,69 +72,33 @@ class Config:
         self.config_file = Path("config/app_config.json")
         self.config_file.parent.mkdir(exist_ok=True)
         
-        # Default configuration
-        self.default_config = {
-            "app": {
-                "name": "Wellness at Work - Eye Tracker",
-                "version": "1.0.0",
-                "debug_mode": False,
-                "auto_start_monitoring": False
-            },
-            "eye_tracking": {
-                "simulation_mode": False,
-                "blink_threshold_frames": 5,
-                "camera_index": 0,
-                "camera_width": 640,
-                "camera_height": 480,
-                "camera_fps": 30
-            },
-            "system_monitoring": {
-                "update_interval_seconds": 2,
-                "metrics_history_minutes": 60,
-                "enable_battery_monitoring": True,
-                "enable_network_monitoring": True
-            },
-            "data": {
-                "auto_sync_enabled": True,
-                "sync_interval_minutes": 5,
-                "retention_days": 30,
-                "database_path": "data/wellness_tracker.db"
-            },
-            "ui": {
-                "theme": "dark",
-                "window_width": 1200,
-                "window_height": 800,
-                "remember_window_position": True,
-                "show_notifications": True
-            },
-            "privacy": {
-                "gdpr_compliance": True,
-                "data_encryption": True,
-                "anonymize_data": False,
-                "consent_required": True
-            },
-            "api": {
-                "base_url": "https://api.wellness-tracker.com",
-                "timeout_seconds": 30,
-                "retry_attempts": 3,
-                "use_ssl": True
-            }
-        }
+        # Default configuration (shared; never mutated)
+        self.default_config = _DEFAULT_CONFIG
         
         # Load configuration
         self.config = self.load_config()
         
+        # Flat dot-path index, rebuilt whenever the config changes
+        self._flat = self._flatten(self.config)
+        self._db_path = None  # cached Path for data.database_path
+        
+        # Debounced saving: bursts of set() calls coalesce into one write
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.RLock()
+        atexit.register(self._flush)
+        
         logger.info("Configuration manager initialized")
     
     def load_config(self):
         """Load configuration from file or create with defaults"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    loaded_config = loads(f.read())
                 
                 # Merge with defaults (in case new keys were added)
-                config = self._merge_configs(self.default_config, loaded_config)
+                config = self._merge_configs(copy.deepcopy(self.default_config), loaded_config)
                 
                 logger.info("Configuration loaded from file")
                 return config
@@ -85,20 +106,20 @@ class Config:
                 # Create config file with defaults
                 self.save_config(self.default_config)
                 logger.info("Created new configuration file with defaults")
-                return self.default_config.copy()
+                return copy.deepcopy(self.default_config)
                 
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             logger.info("Using default configuration")
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
     
     def save_config(self, config=None):
         """Save configuration to file"""
         try:
             config_to_save = config or self.config
             
-            with open(self.config_file, 'w') as f:
-                json.dump(config_to_save, f, indent=4)
+            with open(self.config_file, 'wb') as f:
+                f.write(dumps(config_to_save, indent=True))
             
             logger.info("Configuration saved successfully")
             
@@ -117,18 +138,22 @@ class Config:
             Configuration value or default
         """
         try:
-            keys = key_path.split('.')
-            value = self.config
-            
-            for key in keys:
-                value = value[key]
-            
-            return value
+            return self._flat[key_path]
             
-        except (KeyError, TypeError):
+        except KeyError:
             logger.warning(f"Configuration key '{key_path}' not found, using default: {default}")
             return default
     
+    def _flatten(self, config, prefix=""):
+        """Index every section and value of a nested config by its dot path"""
+        flat = {}
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, path + "."))
+        return flat
+    
     def set(self, key_path, value, save=True):
         """
         Set configuration value using dot notation
@@ -136,36 +161,61 @@ class Config:
         Args:
             key_path (str): Key path like 'app.debug_mode'
             value: Value to set
-            save (bool): Whether to save to file immediately
+            save (bool): Whether to schedule a save to file
         """
         try:
             keys = key_path.split('.')
-            config_ref = self.config
-            
-            # Navigate to parent key
-            for key in keys[:-1]:
-                if key not in config_ref:
-                    config_ref[key] = {}
-                config_ref = config_ref[key]
             
-            # Set the value
-            config_ref[keys[-1]] = value
+            with self._save_lock:
+                config_ref = self.config
+                
+                # Navigate to parent key
+                for key in keys[:-1]:
+                    if key not in config_ref:
+                        config_ref[key] = {}
+                    config_ref = config_ref[key]
+                
+                # Set the value
+                config_ref[keys[-1]] = value
+                self._flat = self._flatten(self.config)
+                if 'data.database_path'.startswith(key_path):
+                    self._db_path = None
             
             if save:
-                self.save_config()
+                self._schedule_save()
             
             logger.debug(f"Configuration updated: {key_path} = {value}")
             
         except Exception as e:
             logger.error(f"Failed to set configuration '{key_path}': {e}")
     
-    def _merge_configs(self, default, loaded):
-        """Recursively merge loaded config with defaults"""
-        merged = default.copy()
-        
+    def _schedule_save(self):
+        """Mark the config dirty and (re)arm the debounced save timer"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _flush(self):
+        """Write the config to file if a save is pending"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save_config()
+    
+    def _merge_configs(self, merged, loaded):
+        """Recursively merge loaded config into a private copy of the defaults, in place"""
         for key, value in loaded.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_configs(merged[key], value)
+            current = merged.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                self._merge_configs(current, value)
             else:
                 merged[key] = value
         
@@ -173,8 +223,12 @@ class Config:
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
-        self.config = self.default_config.copy()
-        self.save_config()
+        with self._save_lock:
+            self.config = copy.deepcopy(self.default_config)
+            self._flat = self._flatten(self.config)
+            self._db_path = None
+            self._dirty = True
+            self._flush()
         logger.info("Configuration reset to defaults")
     
     def get_app_info(self):
@@ -191,7 +245,9 @@ class Config:
     
     def get_database_path(self):
         """Get database file path"""
-        return Path(self.get('data.database_path', 'data/wellness_tracker.db'))
+        if self._db_path is None:
+            self._db_path = Path(self.get('data.database_path', 'data/wellness_tracker.db'))
+        return self._db_path
     
     def is_gdpr_compliant(self):
         """Check if GDPR compliance is enabled"""
@@ -205,9 +261,7 @@ class Config:
         """Check if auto sync is enabled"""
         return self.get('data.auto_sync_enabled', True)
 
-# Global configuration instance
-config = Config()
-
+@lru_cache(maxsize=1)
 def get_config():
-    """Get global configuration instance"""
-    return config
+    """Get global configuration instance, created on first use"""
+    return Config()
@@ -1,22 +1,94 @@
 """
 GDPR Compliance Utilities
 """
+import atexit
 import logging
 import hashlib
-import json
+import queue
+import threading
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
 from cryptography.fernet import Fernet
 
+from .json_codec import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Consent log size that triggers folding it into the snapshot
+CONSENT_LOG_COMPACT_BYTES = 1024 * 1024
+
+# Consents every user must grant; each has a stable bit in the per-user consent mask
+REQUIRED_CONSENTS = (
+    'data_collection',
+    'data_processing',
+    'data_storage',
+    'analytics',
+    'performance_monitoring'
+)
+_CONSENT_BITS = {consent: 1 << index for index, consent in enumerate(REQUIRED_CONSENTS)}
+
+class _AsyncWriter(threading.Thread):
+    """Background thread running file writes in submission order, off the caller's thread"""
+    
+    def __init__(self):
+        super().__init__(name="gdpr-writer", daemon=True)
+        self._queue = queue.Queue()
+        self.start()
+    
+    def submit(self, func, *args):
+        """Queue a write job"""
+        self._queue.put((func, args))
+    
+    def wait(self):
+        """Block until every queued job has run"""
+        self._queue.join()
+    
+    def call(self, func, *args):
+        """Run a job in order with the queued writes and return its result (None if it raised)"""
+        done = threading.Event()
+        result = []
+        
+        def job():
+            try:
+                result.append(func(*args))
+            finally:
+                done.set()
+        
+        self.submit(job)
+        done.wait()
+        return result[0] if result else None
+    
+    def run(self):
+        while True:
+            func, args = self._queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Background write failed: {e}")
+            finally:
+                self._queue.task_done()
+
 class GDPRManager:
     """Manages GDPR compliance features"""
     
     def __init__(self):
-        self.consent_file = Path("data/user_consent.json")
+        self.consent_file = Path("data/user_consent.json")  # snapshot
+        self.consent_log = Path("data/user_consent.log")    # appended NDJSON records since the snapshot
         self.consent_file.parent.mkdir(exist_ok=True)
         
+        # Consents are read from memory; disk is only written by appends and compaction,
+        # both on the background writer
+        self._consent_cache = self._load_consent_data()
+        self._consent_bits = {  # user_id -> mask of granted required consents
+            user_id: self._consent_mask(consents)
+            for user_id, consents in self._consent_cache.items()
+        }
+        self._pending_entries = []  # log lines not yet handed to the writer
+        self._consent_lock = threading.Lock()
+        self._writer = _AsyncWriter()
+        atexit.register(self.flush)
+        
         # Encryption key (in production, store securely)
         self.encryption_key = self._get_or_create_key()
         self.cipher = Fernet(self.encryption_key)
@@ -48,19 +120,26 @@ class GDPRManager:
     def record_consent(self, user_id, consent_type, granted=True):
         """Record user consent"""
         try:
-            consent_data = self._load_consent_data()
-            
-            if user_id not in consent_data:
-                consent_data[user_id] = {}
-            
-            consent_data[user_id][consent_type] = {
+            record = {
                 'granted': granted,
                 'timestamp': datetime.now().isoformat(),
                 'ip_hash': self._hash_ip("127.0.0.1"),  # Placeholder
                 'version': "1.0"
             }
             
-            self._save_consent_data(consent_data)
+            line = dumps({'user_id': user_id, 'consent_type': consent_type, 'record': record}) + b"\n"
+            
+            with self._consent_lock:
+                self._consent_cache.setdefault(user_id, {})[consent_type] = record
+                bit = _CONSENT_BITS.get(consent_type)
+                if bit is not None:
+                    mask = self._consent_bits.get(user_id, 0)
+                    self._consent_bits[user_id] = mask | bit if granted else mask & ~bit
+                self._pending_entries.append(line)
+                
+                # One queued append job drains every line recorded before it runs
+                if len(self._pending_entries) == 1:
+                    self._writer.submit(self._write_pending_entries)
             
             logger.info(f"Consent recorded: {user_id} - {consent_type} - {granted}")
             
@@ -70,7 +149,11 @@ class GDPRManager:
     def check_consent(self, user_id, consent_type):
         """Check if user has granted specific consent"""
         try:
-            consent_data = self._load_consent_data()
+            bit = _CONSENT_BITS.get(consent_type)
+            if bit is not None:
+                return bool(self._consent_bits.get(user_id, 0) & bit)
+            
+            consent_data = self._consent_cache
             
             if user_id in consent_data and consent_type in consent_data[user_id]:
                 return consent_data[user_id][consent_type]['granted']
@@ -84,8 +167,7 @@ class GDPRManager:
     def get_user_consents(self, user_id):
         """Get all consents for a user"""
         try:
-            consent_data = self._load_consent_data()
-            return consent_data.get(user_id, {})
+            return dict(self._consent_cache.get(user_id, {}))
             
         except Exception as e:
             logger.error(f"Failed to get user consents: {e}")
@@ -104,11 +186,14 @@ class GDPRManager:
             
             logger.info(f"Data deletion requested for user: {user_id}")
             
-            # Remove consent records
-            consent_data = self._load_consent_data()
-            if user_id in consent_data:
-                del consent_data[user_id]
-                self._save_consent_data(consent_data)
+            # Remove consent records; compact so the log keeps no history for the user,
+            # and wait for it - erasure is not done until the files no longer hold them
+            with self._consent_lock:
+                removed = self._consent_cache.pop(user_id, None) is not None
+                self._consent_bits.pop(user_id, None)
+            if removed and not self._writer.call(self._compact):
+                logger.error(f"Consent records for {user_id} could not be erased from disk")
+                return False
             
             # In production, would also:
             # 1. Delete from database
@@ -148,7 +233,7 @@ class GDPRManager:
             if isinstance(data, str):
                 data = data.encode()
             elif not isinstance(data, bytes):
-                data = json.dumps(data).encode()
+                data = dumps(data)
             
             encrypted = self.cipher.encrypt(data)
             return encrypted
@@ -174,9 +259,9 @@ class GDPRManager:
             
             for field in fields_to_anonymize:
                 if field in anonymized:
-                    # Replace with hash
+                    # Replace with a 16 hex character hash
                     original_value = str(anonymized[field])
-                    anonymized[field] = hashlib.sha256(original_value.encode()).hexdigest()[:16]
+                    anonymized[field] = hashlib.blake2b(original_value.encode(), digest_size=8).hexdigest()
             
             return anonymized
             
@@ -185,25 +270,85 @@ class GDPRManager:
             return data
     
     def _load_consent_data(self):
-        """Load consent data from file"""
+        """Load the consent snapshot and replay the log on top of it"""
+        consent_data = {}
         try:
             if self.consent_file.exists():
-                with open(self.consent_file, 'r') as f:
-                    return json.load(f)
-            return {}
+                with open(self.consent_file, 'rb') as f:
+                    consent_data = loads(f.read())
+            
+            if self.consent_log.exists():
+                with open(self.consent_log, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        entry = loads(line)
+                        consents = consent_data.setdefault(entry['user_id'], {})
+                        consents[entry['consent_type']] = entry['record']
+            
+            return consent_data
             
         except Exception as e:
             logger.error(f"Failed to load consent data: {e}")
-            return {}
+            return consent_data
+    
+    def _write_pending_entries(self):
+        """Append queued consent lines in one write, compacting once the log grows large (writer thread)"""
+        with self._consent_lock:
+            lines, self._pending_entries = self._pending_entries, []
+        if not lines:
+            return
+        
+        with open(self.consent_log, 'ab') as f:
+            f.write(b"".join(lines))
+            size = f.tell()
+        
+        if size > CONSENT_LOG_COMPACT_BYTES:
+            self._compact()
+    
+    def compact(self):
+        """Fold the consent log into the snapshot and truncate the log, in the background"""
+        self._writer.submit(self._compact)
+    
+    def flush(self):
+        """Wait until every queued consent write has reached disk"""
+        self._writer.wait()
+    
+    def _compact(self):
+        """Write the snapshot and truncate the log, returning True on success (writer thread)"""
+        # The snapshot covers every recorded consent, including lines still pending
+        with self._consent_lock:
+            snapshot = {user_id: dict(consents) for user_id, consents in self._consent_cache.items()}
+            lines, self._pending_entries = self._pending_entries, []
+        
+        # Keep the log, plus anything pending, unless the snapshot now holds everything in it
+        if not self._save_consent_data(snapshot):
+            if lines:
+                with open(self.consent_log, 'ab') as f:
+                    f.write(b"".join(lines))
+            return False
+        
+        try:
+            with open(self.consent_log, 'w'):
+                pass
+            
+            logger.info("Consent log compacted")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to compact consent log: {e}")
+            return False
     
     def _save_consent_data(self, data):
         """Save consent data to file"""
         try:
-            with open(self.consent_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.consent_file, 'wb') as f:
+                f.write(dumps(data, indent=True))
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to save consent data: {e}")
+            return False
     
     def _hash_ip(self, ip_address):
         """Hash IP address for privacy"""
@@ -211,28 +356,30 @@ class GDPRManager:
     
     def get_required_consents(self):
         """Get list of required consents"""
-        return [
-            'data_collection',
-            'data_processing', 
-            'data_storage',
-            'analytics',
-            'performance_monitoring'
-        ]
+        return list(REQUIRED_CONSENTS)
+    
+    def _consent_mask(self, consents):
+        """Fold a user's consent records into a mask of granted required consents"""
+        mask = 0
+        for consent, bit in _CONSENT_BITS.items():
+            record = consents.get(consent)
+            if record and record['granted']:
+                mask |= bit
+        return mask
     
     def generate_privacy_report(self, user_id):
         """Generate privacy compliance report for user"""
         try:
-            consents = self.get_user_consents(user_id)
-            required_consents = self.get_required_consents()
+            mask = self._consent_bits.get(user_id, 0)
             
             report = {
                 'user_id': user_id,
                 'report_date': datetime.now().isoformat(),
                 'gdpr_compliant': True,
                 'consents': {
-                    'total_required': len(required_consents),
-                    'granted': 0,
-                    'missing': []
+                    'total_required': len(REQUIRED_CONSENTS),
+                    'granted': bin(mask).count("1"),
+                    'missing': [consent for consent in REQUIRED_CONSENTS if not mask & _CONSENT_BITS[consent]]
                 },
                 'data_retention': {
                     'policy': '30 days',
@@ -241,12 +388,6 @@ class GDPRManager:
                 }
             }
             
-            for consent in required_consents:
-                if consent in consents and consents[consent]['granted']:
-                    report['consents']['granted'] += 1
-                else:
-                    report['consents']['missing'].append(consent)
-            
             # Check if fully compliant
             if report['consents']['missing']:
                 report['gdpr_compliant'] = False
@@ -257,9 +398,7 @@ class GDPRManager:
             logger.error(f"Failed to generate privacy report: {e}")
             return None
 
-# Global GDPR manager instance
-gdpr_manager = GDPRManager()
-
+@lru_cache(maxsize=1)
 def get_gdpr_manager():
-    """Get global GDPR manager instance"""
-    return gdpr_manager
+    """Get global GDPR manager instance, created on first use"""
+    return GDPRManager()
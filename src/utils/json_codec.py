@@ -0,0 +1,22 @@
+"""
+JSON encoding helpers, backed by orjson when it is installed
+"""
+import json
+
+try:
+    import orjson
+    
+    def dumps(obj, indent=False):
+        """Serialize to UTF-8 JSON bytes, indented by two spaces if requested"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    loads = orjson.loads
+    
+except ImportError:
+    def dumps(obj, indent=False):
+        """Serialize to UTF-8 JSON bytes, indented by two spaces if requested"""
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    loads = json.loads
@@ -4,36 +4,95 @@ Logging Configuration for the Wellness at Work Application
 import logging
 import logging.handlers
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
-def setup_logger(name=None, level=logging.INFO):
-    """
-    Setup application logger with file and console handlers
-    
-    Args:
-        name (str): Logger name (defaults to root logger)
-        level (int): Logging level
-    
-    Returns:
-        logging.Logger: Configured logger instance
-    """
+# File and console handlers, built on first setup and shared by every configured logger
+_handlers = None
+
+# Longest a below-WARNING record may wait in the log file's write buffer, in seconds
+_LOG_FLUSH_INTERVAL = 1.0
+
+class _BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that lets records accumulate in the stream buffer between flushes"""
+    
+    def __init__(self, *args, **kwargs):
+        self._size = 0  # bytes in the current file, set by _open()
+        self._flush_timer = None  # pending flush of buffered records
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        """Open the log file and take its size; stream.tell() would flush on every record"""
+        stream = super()._open()
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record):
+        """Write a record, flushing at once for warnings and otherwise within one interval"""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            
+            msg = self.format(record) + self.terminator
+            size = len(msg) if msg.isascii() else len(msg.encode(self.stream.encoding, 'replace'))
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._size += size
+            
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                # Idle periods still reach disk: flush whatever is buffered after the interval
+                self._flush_timer = threading.Timer(_LOG_FLUSH_INTERVAL, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _timed_flush(self):
+        """Flush records buffered since the timer was started (timer thread)"""
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+    
+    def close(self):
+        """Cancel the pending timed flush and write out buffered records before closing"""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self.flush()
+        super().close()
+
+def _get_handlers():
+    """Build the shared file and console handlers once"""
+    global _handlers
+    if _handlers is not None:
+        return _handlers
+    
+    # Skip per-record caller, thread and process lookups the formats never show
+    # (see "Optimization" in the logging HOWTO)
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Create logs directory
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
-    # Configure logger
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
     # Create formatters
     file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
     console_formatter = logging.Formatter(
@@ -43,7 +102,7 @@ def setup_logger(name=None, level=logging.INFO):
     
     # File handler (rotating)
     log_file = log_dir / f"wellness_tracker_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = _BatchedRotatingFileHandler(
         log_file,
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
@@ -56,9 +115,32 @@ def setup_logger(name=None, level=logging.INFO):
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    _handlers = (file_handler, console_handler)
+    return _handlers
+
+def setup_logger(name=None, level=logging.INFO):
+    """
+    Setup application logger with file and console handlers
+    
+    Args:
+        name (str): Logger name (defaults to root logger)
+        level (int): Logging level
+    
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    
+    # Configure logger
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    
+    # Avoid duplicate handlers
+    if logger.handlers:
+        return logger
+    
+    # Add the shared handlers
+    for handler in _get_handlers():
+        logger.addHandler(handler)
     
     # Set levels for specific modules
     logging.getLogger('PyQt5').setLevel(logging.WARNING)
@@ -85,37 +167,46 @@ def set_debug_mode(enabled=True):
             if isinstance(handler, logging.StreamHandler):
                 handler.setLevel(level)
 
-def log_system_info():
-    """Log system information for debugging"""
-    logger = logging.getLogger(__name__)
-    
+@lru_cache(maxsize=1)
+def _system_info_lines():
+    """Collect system information once per process as (level, message) pairs"""
     import platform
     import sys
     
-    logger.info("=" * 50)
-    logger.info("SYSTEM INFORMATION")
-    logger.info("=" * 50)
-    logger.info(f"Platform: {platform.platform()}")
-    logger.info(f"Python Version: {sys.version}")
-    logger.info(f"Architecture: {platform.architecture()}")
-    logger.info(f"Processor: {platform.processor()}")
+    lines = [
+        (logging.INFO, "=" * 50),
+        (logging.INFO, "SYSTEM INFORMATION"),
+        (logging.INFO, "=" * 50),
+        (logging.INFO, f"Platform: {platform.platform()}"),
+        (logging.INFO, f"Python Version: {sys.version}"),
+        (logging.INFO, f"Architecture: {platform.architecture()}"),
+        (logging.INFO, f"Processor: {platform.processor()}")
+    ]
     
     try:
         import PyQt5.QtCore
-        logger.info(f"PyQt5 Version: {PyQt5.QtCore.QT_VERSION_STR}")
+        lines.append((logging.INFO, f"PyQt5 Version: {PyQt5.QtCore.QT_VERSION_STR}"))
     except ImportError:
-        logger.warning("PyQt5 not available")
+        lines.append((logging.WARNING, "PyQt5 not available"))
     
     try:
         import cv2
-        logger.info(f"OpenCV Version: {cv2.__version__}")
+        lines.append((logging.INFO, f"OpenCV Version: {cv2.__version__}"))
     except ImportError:
-        logger.warning("OpenCV not available")
+        lines.append((logging.WARNING, "OpenCV not available"))
     
     try:
         import psutil
-        logger.info(f"psutil Version: {psutil.__version__}")
+        lines.append((logging.INFO, f"psutil Version: {psutil.__version__}"))
     except ImportError:
-        logger.warning("psutil not available")
+        lines.append((logging.WARNING, "psutil not available"))
+    
+    lines.append((logging.INFO, "=" * 50))
+    return tuple(lines)
+
+def log_system_info():
+    """Log system information for debugging"""
+    logger = logging.getLogger(__name__)
     
-    logger.info("=" * 50)
+    for level, message in _system_info_lines():
+        logger.log(level, message)